@@ -5,6 +5,7 @@ Centralizes authentication-related settings and validation rules
 
 import os
 import re
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
 class AuthConfig:
@@ -20,6 +21,12 @@ class AuthConfig:
     # Special characters allowed in passwords
     SPECIAL_CHARACTERS = "!@#$%^&*()_+-=[]{}|;:,.<>?"
 
+    # Password policy patterns, compiled once
+    _UPPERCASE_RE = re.compile(r'[A-Z]')
+    _LOWERCASE_RE = re.compile(r'[a-z]')
+    _SPECIAL_RE = re.compile(f'[{re.escape(SPECIAL_CHARACTERS)}]')
+    _NUMBER_RE = re.compile(r'\d')
+
     # Captcha configuration
     RECAPTCHA_SITE_KEY = os.getenv('RECAPTCHA_SITE_KEY')
     RECAPTCHA_SECRET_KEY = os.getenv('RECAPTCHA_SECRET_KEY')
@@ -47,24 +54,25 @@ class AuthConfig:
         if len(password) < cls.MIN_PASSWORD_LENGTH:
             errors.append(f"Password must be at least {cls.MIN_PASSWORD_LENGTH} characters long.")
 
-        if cls.PASSWORD_REQUIRE_UPPERCASE and not re.search(r'[A-Z]', password):
+        if cls.PASSWORD_REQUIRE_UPPERCASE and not cls._UPPERCASE_RE.search(password):
             errors.append("Password must contain at least one uppercase letter.")
 
-        if cls.PASSWORD_REQUIRE_LOWERCASE and not re.search(r'[a-z]', password):
+        if cls.PASSWORD_REQUIRE_LOWERCASE and not cls._LOWERCASE_RE.search(password):
             errors.append("Password must contain at least one lowercase letter.")
 
-        if cls.PASSWORD_REQUIRE_SPECIAL and not re.search(f'[{re.escape(cls.SPECIAL_CHARACTERS)}]', password):
+        if cls.PASSWORD_REQUIRE_SPECIAL and not cls._SPECIAL_RE.search(password):
             errors.append(f"Password must contain at least one special character ({cls.SPECIAL_CHARACTERS[:10]}...)")
 
-        if cls.PASSWORD_REQUIRE_NUMBER and not re.search(r'\d', password):
+        if cls.PASSWORD_REQUIRE_NUMBER and not cls._NUMBER_RE.search(password):
             errors.append("Password must contain at least one number.")
 
         return len(errors) == 0, errors
         
 
     @classmethod
+    @lru_cache(maxsize=None)
     def get_password_requirements(cls) -> str:
-        """ Get a human-readable string of password requirements """
+        """ Get a human-readable string of password requirements (fixed per process) """
         requirements = [f"At least {cls.MIN_PASSWORD_LENGTH} characters long"]
 
         if cls.PASSWORD_REQUIRE_UPPERCASE:
@@ -2,10 +2,14 @@ import os
 from urllib.parse import urlparse
 from flask import Flask, request, get_flashed_messages, redirect, abort
 from flask_migrate import Migrate
+from flask_session import Session
 from jinja2 import FileSystemLoader, ChoiceLoader
+from werkzeug.middleware.proxy_fix import ProxyFix
 import re
+import atexit
+import queue
 import logging
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import TimedRotatingFileHandler, QueueHandler, QueueListener
 from datetime import timedelta
 from dotenv import load_dotenv
 
@@ -59,8 +63,14 @@ def setup_logging():
     # Clear any existing handlers to avoid duplicates
     root_logger.handlers.clear()
     
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    # Request threads only enqueue records; file and console I/O happen on
+    # the listener's background thread so a slow disk never blocks a request
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # Flush queued records on shutdown
+    
+    root_logger.addHandler(QueueHandler(log_queue))
     
     logging.info("Centralized logging initialized - logs will rotate daily, keeping 30 days")
 
@@ -78,6 +88,9 @@ from routes.health_routes import health
 from routes.api import api_bp, register_api_routes
 from model import db
 from services import init_email_service
+from utils.redis_client import init_redis
+from utils.rate_limit import init_rate_limiter
+from utils.json_provider import OrjsonProvider
 
 
 
@@ -102,6 +115,26 @@ def configure_session(app):
         SESSION_COOKIE_SAMESITE='Lax'  # Protect against CSRF
     )
 
+
+def configure_session_backend(app):
+    """
+    Store sessions server-side in Redis when REDIS_URL is configured.
+
+    The cookie then only carries a random session id; without Redis, Flask's
+    default signed-cookie sessions are used.
+    """
+    redis_client = init_redis(app)
+    if redis_client is None:
+        return
+
+    app.config.update(
+        SESSION_TYPE='redis',
+        SESSION_REDIS=redis_client,
+        SESSION_KEY_PREFIX='session:',
+    )
+    Session(app)
+    logging.info("Using Redis server-side sessions")
+
 def get_version():
     try:
         with open('VERSION', 'r') as f:
@@ -122,6 +155,7 @@ def create_app(test_config=None):
     
     # Initialize Flask app
     app = Flask(__name__, static_folder="static")
+    app.json = OrjsonProvider(app)
     
     # Store version in app config
     app.config['VERSION'] = get_version()
@@ -178,11 +212,43 @@ def create_app(test_config=None):
     app.config["SQLALCHEMY_DATABASE_URI"] = database_url
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 
+    # Reject oversized request bodies before they are read or parsed (413)
+    app.config['MAX_CONTENT_LENGTH'] = int(os.getenv('MAX_CONTENT_LENGTH', 1024 * 1024))
+
+    # Optional Redis (server-side sessions, caching)
+    app.config['REDIS_URL'] = os.getenv('REDIS_URL')
+
+    # Reverse proxies in front of the app whose X-Forwarded-For entries are
+    # trusted; none when running locally. In production gunicorn only listens
+    # on 127.0.0.1 behind two hops: the Heroku router appends the client, and
+    # the Next.js rewrite proxy (xfwd) appends the router's address.
+    app.config['TRUSTED_PROXIES'] = int(os.getenv('TRUSTED_PROXIES', '0' if is_local else '2'))
+
     # Apply test overrides BEFORE the engine binds to a database, so test
     # suites never connect to the real DATABASE_URL from the environment.
     if test_config:
         app.config.update(test_config)
 
+    # Size the per-worker PostgreSQL pool for concurrent requests instead of
+    # SQLAlchemy's default of 5; SQLite uses its own single-connection pools.
+    # Pre-ping and recycling replace connections the server or a proxy has
+    # dropped while idle, instead of failing the next request that gets one.
+    if app.config["SQLALCHEMY_DATABASE_URI"].startswith("postgresql"):
+        app.config.setdefault("SQLALCHEMY_ENGINE_OPTIONS", {
+            "pool_size": int(os.getenv('DB_POOL_SIZE', '10')),
+            "max_overflow": int(os.getenv('DB_MAX_OVERFLOW', '10')),
+            "pool_pre_ping": True,
+            "pool_recycle": int(os.getenv('DB_POOL_RECYCLE', '1800')),
+        })
+
+    # Take the client address from the hop our own proxy appended, so
+    # request.remote_addr (logs, rate limit keys) can't be spoofed
+    if app.config['TRUSTED_PROXIES']:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config['TRUSTED_PROXIES'])
+
+    configure_session_backend(app)
+    init_rate_limiter(app)
+
     # Initialize the db and migrations
     db.init_app(app)
     migrate = Migrate(app, db, render_as_batch=True)  # Enable batch mode for SQLite
@@ -70,8 +70,9 @@ class User(db.Model):
     usage_logs = db.relationship(
         "UsageLog", back_populates="user", cascade="all, delete-orphan"
     )
+    # selectin: loading any set of users fetches their tool access in one batched query
     tool_access = db.relationship(
-        "ToolAccess", back_populates="user", cascade="all, delete-orphan"
+        "ToolAccess", back_populates="user", cascade="all, delete-orphan", lazy="selectin"
     )
     email_templates = db.relationship(
         "EmailTemplate", order_by="EmailTemplate.id", back_populates="user", cascade="all, delete-orphan"
@@ -1,4 +1,4 @@
-from flask import Blueprint, request, jsonify, redirect, url_for, render_template, session, flash, get_flashed_messages
+from flask import Blueprint, request, jsonify, redirect, url_for, render_template, session, flash
 from model import User, Admin, SuperAdmin, Tool, ToolAccess, db
 from sqlalchemy.exc import SQLAlchemyError
 import logging
@@ -11,10 +11,10 @@ admin = Blueprint('admin', __name__)
 @admin.route("/admin_dashboard", methods=["GET"])
 def admin_dashboard():
     if "logged_in" in session and session.get("role") in ["admin", "super_admin"]:
+        # User.tool_access is selectin-loaded, so all users' rows arrive in one extra query
         users = User.query.all()
         tools = ToolAccess.get_distinct_tool_names()
-        user_tools = {user.id: [access.tool_name for access in user.tool_access] for user in users}
-        return render_template("admin_dashboard.html", users=users, tools=tools, user_tools=user_tools)
+        return render_template("admin_dashboard.html", users=users, tools=tools)
     return redirect(url_for("auth.login"))
 
 @admin.route("/superadmin_dashboard", methods=["GET"])
@@ -22,9 +22,7 @@ def superadmin_dashboard():
     if "logged_in" in session and session.get("role") == "super_admin":
         users = User.query.all()
         tools = Tool.query.all()  # Fetch all tools, regardless of default status
-        user_tools = {user.id: [access.tool_name for access in user.tool_access] for user in users}
-        messages = session.pop('_flashes', [])
-        return render_template("superadmin_dashboard.html", users=users, tools=tools, user_tools=user_tools, messages=messages)
+        return render_template("superadmin_dashboard.html", users=users, tools=tools)
     return redirect(url_for("auth.login"))
 
 
@@ -95,7 +93,10 @@ def update_user(user_id: int):
 @admin.route("/delete_user/<int:user_id>", methods=["POST"])
 def delete_user(user_id):
     if "logged_in" in session and session.get("role") in ["admin", "super_admin"]:
-        user = User.query.get(user_id)
+        # A bulk Query.delete() would skip the ORM cascades (tool access, usage
+        # logs, templates, subscriptions, admin rows), so delete through the
+        # session. Session.get() is served from the identity map when possible.
+        user = db.session.get(User, user_id)
         if user:
             db.session.delete(user)
             db.session.commit()
@@ -166,10 +167,7 @@ def manage_tools():
             return jsonify({"message": "Tool deleted successfully"}), 200
         else:
             return jsonify({"error": "Tool not found"}), 404
-        
 
-    # Clear any unused flash messages
-    _ = get_flashed_messages()
 
     tools = Tool.query.all()
     return render_template('manage_tools.html', tools=tools)
@@ -14,11 +14,18 @@ API Version: v1
 Base URL: /api/v1
 """
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, current_app, request, session
 from functools import wraps
 import logging
 import secrets
 
+import orjson
+from flask_limiter import RateLimitExceeded
+from werkzeug.exceptions import RequestEntityTooLarge
+
+from model import db, User
+from .schemas import validate_request
+
 logger = logging.getLogger(__name__)
 
 # Create the main API blueprint with /api/v1 prefix
@@ -34,8 +41,6 @@ def enforce_csrf():
     must be echoed back in the X-CSRFToken header for POST/PUT/PATCH/DELETE.
     Disabled when WTF_CSRF_ENABLED is False (test config).
     """
-    from flask import session, current_app
-
     if request.method not in ('POST', 'PUT', 'PATCH', 'DELETE'):
         return None
 
@@ -47,7 +52,7 @@ def enforce_csrf():
 
     if not header_token or not session_token or \
             not secrets.compare_digest(header_token, session_token):
-        logger.warning(f"CSRF validation failed: {request.method} {request.path}")
+        logger.warning("CSRF validation failed: %s %s", request.method, request.path)
         return api_error(
             "CSRF_ERROR",
             "Invalid or missing CSRF token. Fetch a new token from /api/v1/auth/csrf.",
@@ -57,33 +62,60 @@ def enforce_csrf():
     return None
 
 
+# Datetimes go through the app's JSON provider so they keep the same format
+# jsonify produced; everything else orjson serializes natively.
+_ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+def _json(payload, status_code):
+    """Serialize an envelope with orjson into a Flask JSON response."""
+    try:
+        body = orjson.dumps(payload, default=current_app.json.default, option=_ORJSON_OPTIONS)
+    except TypeError:
+        # orjson rejects what the stdlib encoder accepts, e.g. integers
+        # beyond 64 bits; fall back to the app's JSON provider for those.
+        body = current_app.json.dumps(payload)
+    return Response(body, status=status_code, mimetype='application/json')
+
+
+@api_bp.errorhandler(RateLimitExceeded)
+def handle_rate_limited(e):
+    """Return rate limit rejections in the standard error envelope."""
+    logger.warning("Rate limit exceeded: %s %s (%s)", request.method, request.path, e.description)
+    return api_error(
+        "AUTH_RATE_LIMITED",
+        "Too many requests. Please wait a moment and try again.",
+        status_code=429
+    )
+
+
+@api_bp.errorhandler(RequestEntityTooLarge)
+def handle_too_large(e):
+    """Return oversized request bodies (over MAX_CONTENT_LENGTH) in the standard error envelope."""
+    logger.warning("Request body too large: %s %s (%s bytes)", request.method, request.path, request.content_length)
+    return api_error(
+        "VALIDATION_ERROR",
+        "Request body is too large.",
+        status_code=413
+    )
+
+
 def api_response(data=None, status_code=200):
     """
     Create a standardized API success response.
 
     Args:
-        data: Response data (dict, list, or object with to_dict method)
+        data: Response data (JSON-serializable, or an object with to_dict method).
+            Lists must already contain serializable items.
         status_code: HTTP status code (default 200)
 
     Returns:
         Flask JSON response
     """
-    response = {"success": True}
-
-    if data is not None:
-        if hasattr(data, 'to_dict'):
-            response["data"] = data.to_dict()
-        elif isinstance(data, list):
-            response["data"] = [
-                item.to_dict() if hasattr(item, 'to_dict') else item
-                for item in data
-            ]
-        else:
-            response["data"] = data
-    else:
-        response["data"] = None
+    if hasattr(data, 'to_dict'):
+        data = data.to_dict()
 
-    return jsonify(response), status_code
+    return _json({"success": True, "data": data}, status_code)
 
 
 def api_error(code, message, status_code=400, details=None):
@@ -106,12 +138,26 @@ def api_error(code, message, status_code=400, details=None):
     if details:
         error["details"] = details
 
-    response = {
-        "success": False,
-        "error": error
-    }
+    return _json({"success": False, "error": error}, status_code)
 
-    return jsonify(response), status_code
+
+def service_error(result):
+    """
+    Create a standardized API error response from a failed ServiceResult.
+
+    Args:
+        result: ServiceResult with is_failure True
+
+    Returns:
+        Flask JSON response
+    """
+    error = result.error
+    return api_error(
+        error.code.value,
+        error.message,
+        status_code=error.http_status,
+        details=error.details
+    )
 
 
 def require_auth(f):
@@ -121,10 +167,8 @@ def require_auth(f):
     """
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        from flask import session
-
         if 'user_id' not in session:
-            logger.warning(f"Unauthorized API access attempt: {request.path}")
+            logger.warning("Unauthorized API access attempt: %s", request.path)
             return api_error(
                 "AUTH_REQUIRED",
                 "Authentication required. Please log in.",
@@ -143,10 +187,6 @@ def require_verified(f):
     """
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        from flask import session
-        from services import get_auth_service
-        from model import User
-
         user_id = session.get('user_id')
         if not user_id:
             return api_error(
@@ -155,7 +195,9 @@ def require_verified(f):
                 status_code=401
             )
 
-        user = User.query.get(user_id)
+        user = db.session.query(
+            User.id, User.email, User.email_verified
+        ).filter_by(id=user_id).first()
         if not user:
             return api_error(
                 "AUTH_REQUIRED",
@@ -163,8 +205,7 @@ def require_verified(f):
                 status_code=401
             )
 
-        auth_service = get_auth_service()
-        if not auth_service.check_email_verified(user):
+        if not user.email_verified:
             return api_error(
                 "AUTH_UNVERIFIED",
                 "Email verification required.",
@@ -190,13 +231,11 @@ def require_role(*roles):
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            from flask import session
-
             user_role = session.get('role')
             if user_role not in roles:
                 logger.warning(
-                    f"Permission denied: user role '{user_role}' "
-                    f"attempted to access {request.path} (requires {roles})"
+                    "Permission denied: user role '%s' attempted to access %s (requires %s)",
+                    user_role, request.path, roles
                 )
                 return api_error(
                     "PERMISSION_DENIED",
@@ -209,6 +248,25 @@ def require_role(*roles):
     return decorator
 
 
+def conditional_get(f):
+    """
+    Decorator to tag successful GET responses with an ETag of the body.
+    Returns 304 with no body when the client's If-None-Match matches.
+    Must be used after require_auth.
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        response = f(*args, **kwargs)
+        if response.status_code != 200:
+            return response
+
+        response.add_etag()
+        # Per-user data: browsers may keep it but must revalidate each time
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response.make_conditional(request)
+    return decorated_function
+
+
 def get_json_body():
     """
     Get JSON body from request with error handling.
@@ -225,30 +283,39 @@ def get_json_body():
             status_code=400
         )
 
+    raw = request.get_data(cache=False)
+    if not raw:
+        return None, api_error(
+            "VALIDATION_ERROR",
+            "Invalid or empty JSON body",
+            status_code=400
+        )
+
     try:
-        data = request.get_json()
-        if data is None:
-            return None, api_error(
-                "VALIDATION_ERROR",
-                "Invalid or empty JSON body",
-                status_code=400
-            )
-        return data, None
-    except Exception as e:
-        logger.error(f"JSON parsing error: {e}")
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError as e:
+        logger.error("JSON parsing error: %s", e)
         return None, api_error(
             "VALIDATION_ERROR",
             "Invalid JSON format",
             status_code=400
         )
 
+    if data is None:
+        return None, api_error(
+            "VALIDATION_ERROR",
+            "Invalid or empty JSON body",
+            status_code=400
+        )
+    return data, None
+
 
-def validate_with_schema(schema_class, data):
+def validate_with_schema(schema, data):
     """
     Validate request data using a marshmallow schema.
 
     Args:
-        schema_class: Marshmallow schema class
+        schema: Marshmallow schema instance (see schemas.py, e.g. LOGIN_SCHEMA)
         data: Dictionary of request data
 
     Returns:
@@ -256,9 +323,7 @@ def validate_with_schema(schema_class, data):
         - If valid: (dict, None)
         - If invalid: (None, Flask error response)
     """
-    from .schemas import validate_request
-
-    validated, errors = validate_request(schema_class, data)
+    validated, errors = validate_request(schema, data)
 
     if errors:
         # Format errors into a user-friendly message
@@ -279,12 +344,12 @@ def validate_with_schema(schema_class, data):
     return validated, None
 
 
-def get_validated_json(schema_class):
+def get_validated_json(schema):
     """
     Get and validate JSON body from request in one step.
 
     Args:
-        schema_class: Marshmallow schema class for validation
+        schema: Marshmallow schema instance for validation
 
     Returns:
         Tuple of (validated_data, error_response)
@@ -295,11 +360,11 @@ def get_validated_json(schema_class):
     if error:
         return None, error
 
-    return validate_with_schema(schema_class, data)
+    return validate_with_schema(schema, data)
 
 
 # Import and register sub-blueprints after defining utilities
-# This avoids circular imports
+# This avoids circular imports (the sub-modules import the helpers above)
 _routes_registered = False
 
 
@@ -22,7 +22,7 @@ superadmin-only routes are additionally gated with require_role('super_admin').
 from flask import Blueprint, session, request
 import logging
 
-from . import api_response, api_error, get_json_body, require_auth, require_role
+from . import api_response, api_error, service_error, get_json_body, require_auth, require_role
 from services import get_admin_service
 
 logger = logging.getLogger(__name__)
@@ -32,11 +32,7 @@ admin_api_bp = Blueprint('admin_api', __name__, url_prefix='/admin')
 
 def _result_response(result, status_code=200):
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        return service_error(result)
     return api_response(result.data, status_code=status_code)
 
 
@@ -107,11 +103,7 @@ def delete_user(user_id):
     """Delete a user."""
     result = get_admin_service().delete_user(session.get('role'), user_id)
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        return service_error(result)
     return '', 204
 
 
@@ -192,11 +184,7 @@ def list_tools():
     """List the full tool catalog (used by ToolAccessDialog and Manage Tools)."""
     result = get_admin_service().list_tools()
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        return service_error(result)
     return api_response({"tools": result.data})
 
 
@@ -243,9 +231,5 @@ def delete_tool(tool_id):
     """Delete a tool. Also revokes any existing grants for it."""
     result = get_admin_service().delete_tool(tool_id)
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        return service_error(result)
     return '', 204
@@ -12,19 +12,48 @@ Handles all authentication-related JSON API endpoints:
 - POST /api/v1/auth/resend-verification
 """
 
-from flask import Blueprint, session, request
+from flask import Blueprint, Response, current_app, session, request
+import hashlib
 import logging
 import secrets
 
-from . import api_response, api_error, get_json_body, require_auth
-from services import get_auth_service
+import orjson
+
+from . import (
+    api_response, api_error, service_error, get_json_body, require_auth
+)
+from services import get_auth_service, get_cached_user_profile, cache_user_profile
+from utils.rate_limit import limiter
 
 logger = logging.getLogger(__name__)
 
 auth_api_bp = Blueprint('auth_api', __name__, url_prefix='/auth')
 
 
+def _static_body(data):
+    """Serialize a constant success envelope once, at import time."""
+    return orjson.dumps({"success": True, "data": data})
+
+
+def _static_response(body):
+    """Wrap a pre-serialized envelope in a fresh response."""
+    return Response(body, mimetype='application/json')
+
+
+# Success bodies that never vary are serialized once instead of per request
+_LOGOUT_BODY = _static_body(None)
+_RESET_REQUESTED_BODY = _static_body({
+    "message": "If an account with that email exists, a password reset link has been sent."
+})
+_VERIFICATION_SENT_BODY = _static_body({
+    "message": "Verification email has been sent. Please check your inbox."
+})
+_ANON_STATUS_BODY = _static_body({"isAuthenticated": False, "user": None})
+_ANON_STATUS_ETAG = hashlib.sha1(_ANON_STATUS_BODY).hexdigest()
+
+
 @auth_api_bp.route('/login', methods=['POST'])
+@limiter.limit("10 per minute")
 def login():
     """
     Authenticate user and create session.
@@ -41,6 +70,7 @@ def login():
         400: Validation error
         401: Invalid credentials
         403: Email not verified (AUTH_UNVERIFIED)
+        429: Too many attempts from this IP (AUTH_RATE_LIMITED)
     """
     data, error = get_json_body()
     if error:
@@ -59,12 +89,7 @@ def login():
     )
 
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status,
-            details=result.error.details
-        )
+        return service_error(result)
 
     # Set session data
     login_result = result.data
@@ -73,15 +98,20 @@ def login():
     # Prevent session fixation: start a fresh session and rotate the CSRF
     # token on privilege change (the API client refreshes on CSRF_ERROR).
     session.clear()
-    session['csrf_token'] = secrets.token_hex(32)
-
-    session['user_id'] = user.id
-    session['username'] = user.username
-    session['role'] = user.role
-    session['email'] = user.email
+    session.update({
+        'csrf_token': secrets.token_urlsafe(32),
+        'user_id': user.id,
+        'username': user.username,
+        'role': user.role,
+        'email': user.email,
+    })
     session.permanent = False  # Expire on browser close
+    # Server-side (Redis) sessions also need a new session id. Flask-Session
+    # skips empty sessions, so this runs after the keys are written.
+    if hasattr(current_app.session_interface, 'regenerate'):
+        current_app.session_interface.regenerate(session)
 
-    logger.info(f"API Login successful for user: {user.username}")
+    logger.info("API Login successful for user: %s", user.username)
 
     return api_response({
         "user": user.to_dict(),
@@ -99,11 +129,12 @@ def logout():
     """
     username = session.get('username', 'unknown')
     session.clear()
-    logger.info(f"API Logout successful for user: {username}")
-    return api_response(None)
+    logger.info("API Logout successful for user: %s", username)
+    return _static_response(_LOGOUT_BODY)
 
 
 @auth_api_bp.route('/register', methods=['POST'])
+@limiter.limit("5 per hour")
 def register():
     """
     Register a new user account.
@@ -146,14 +177,9 @@ def register():
     )
 
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status,
-            details=result.error.details
-        )
+        return service_error(result)
 
-    logger.info(f"API Registration successful for user: {username}")
+    logger.info("API Registration successful for user: %s", username)
     return api_response(result.data.to_dict(), status_code=201)
 
 
@@ -162,6 +188,9 @@ def auth_status():
     """
     Get current authentication status.
 
+    Anonymous responses carry an ETag, so repeat polls are answered with
+    304 Not Modified and no body.
+
     Returns:
         200: {
             "success": true,
@@ -170,29 +199,41 @@ def auth_status():
                 "user": UserProfile | null
             }
         }
+        304: Anonymous and If-None-Match matches
     """
     user_id = session.get('user_id')
 
     if not user_id:
-        return api_response({
-            "isAuthenticated": False,
-            "user": None
-        })
-
-    auth_service = get_auth_service()
-    result = auth_service.get_user_by_id(user_id)
-
-    if result.is_failure:
-        # User not found - clear invalid session
-        session.clear()
-        return api_response({
-            "isAuthenticated": False,
-            "user": None
-        })
+        response = _static_response(_ANON_STATUS_BODY)
+        response.set_etag(_ANON_STATUS_ETAG)
+        # Revalidate on every poll rather than trusting a max-age, so a
+        # login in another tab is never hidden behind a cached "anonymous"
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response.make_conditional(request)
+
+    # Polled on every SPA navigation; serve from the short-lived user cache
+    # (no-op without Redis, evicted on every committed user/tool access
+    # change) before falling back to the database
+    user = get_cached_user_profile(user_id)
+
+    if user is None:
+        auth_service = get_auth_service()
+        result = auth_service.get_user_by_id(user_id)
+
+        if result.is_failure:
+            # User not found - clear invalid session
+            session.clear()
+            return api_response({
+                "isAuthenticated": False,
+                "user": None
+            })
+
+        user = result.data.to_dict()
+        cache_user_profile(user_id, user)
 
     return api_response({
         "isAuthenticated": True,
-        "user": result.data.to_dict()
+        "user": user
     })
 
 
@@ -207,11 +248,9 @@ def get_csrf_token():
     Returns:
         200: {"success": true, "data": {"csrfToken": "string"}}
     """
-    import secrets
-
     # Generate token if not exists
     if 'csrf_token' not in session:
-        session['csrf_token'] = secrets.token_hex(32)
+        session['csrf_token'] = secrets.token_urlsafe(32)
 
     return api_response({
         "csrfToken": session['csrf_token']
@@ -219,6 +258,7 @@ def get_csrf_token():
 
 
 @auth_api_bp.route('/forgot-password', methods=['POST'])
+@limiter.limit("3 per minute")
 def forgot_password():
     """
     Request password reset email.
@@ -233,6 +273,7 @@ def forgot_password():
 
     Returns:
         200: {"success": true, "data": {"message": "..."}}
+        429: Too many requests from this IP (AUTH_RATE_LIMITED)
     """
     data, error = get_json_body()
     if error:
@@ -251,9 +292,7 @@ def forgot_password():
     auth_service.request_password_reset(email)
 
     # Always return success for security
-    return api_response({
-        "message": "If an account with that email exists, a password reset link has been sent."
-    })
+    return _static_response(_RESET_REQUESTED_BODY)
 
 
 @auth_api_bp.route('/reset-password', methods=['POST'])
@@ -295,12 +334,7 @@ def reset_password():
     )
 
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status,
-            details=result.error.details
-        )
+        return service_error(result)
 
     logger.info("API Password reset successful")
     return api_response({
@@ -339,15 +373,11 @@ def validate_reset_token():
     result = auth_service.validate_reset_token(token)
 
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        return service_error(result)
 
     # Mask email for privacy
-    email = result.data
-    masked_email = email[0] + '***' + email[email.index('@'):]
+    local, _, domain = result.data.partition('@')
+    masked_email = f"{local[:1]}***@{domain}"
 
     return api_response({
         "valid": True,
@@ -356,6 +386,7 @@ def validate_reset_token():
 
 
 @auth_api_bp.route('/resend-verification', methods=['POST'])
+@limiter.limit("3 per minute")
 def resend_verification():
     """
     Resend email verification link.
@@ -370,6 +401,7 @@ def resend_verification():
         200: {"success": true, "data": {"message": "..."}}
         400: Validation error
         404: User not found
+        429: Too many requests from this IP (AUTH_RATE_LIMITED)
     """
     data, error = get_json_body()
     if error:
@@ -388,13 +420,7 @@ def resend_verification():
     result = auth_service.resend_verification_email(email)
 
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        return service_error(result)
 
-    logger.info(f"API Verification email resent to: {email}")
-    return api_response({
-        "message": "Verification email has been sent. Please check your inbox."
-    })
+    logger.info("API Verification email resent to: %s", email)
+    return _static_response(_VERIFICATION_SENT_BODY)
@@ -6,8 +6,15 @@ These ensure input data conforms to expected formats before
 being processed by services.
 """
 
+import re
+
 from marshmallow import Schema, fields, validate, validates, ValidationError
 
+from services.tool_service import TAX_CALCULATOR_TYPES
+
+
+USERNAME_RE = re.compile(r'^[a-zA-Z0-9_]+$')
+
 
 # ==================== Auth Schemas ====================
 
@@ -41,7 +48,7 @@ class RegisterSchema(Schema):
         validate=[
             validate.Length(min=3, max=50),
             validate.Regexp(
-                r'^[a-zA-Z0-9_]+$',
+                USERNAME_RE,
                 error="Username can only contain letters, numbers, and underscores."
             )
         ],
@@ -72,7 +79,7 @@ class RegisterSchema(Schema):
     )
 
     @validates('confirm_password')
-    def validate_confirm_password(self, value):
+    def validate_confirm_password(self, value, **kwargs):
         """Validate passwords match during load."""
         # Note: This runs per-field, cross-field validation done in service
         pass
@@ -241,11 +248,14 @@ class TaxOptionsSchema(Schema):
     discount_is_taxable = fields.Bool(load_default=True)
 
 
+TAX_OPTIONS_DEFAULT = TaxOptionsSchema().load({})
+
+
 class TaxCalculationSchema(Schema):
     """Schema for tax calculation request."""
     calculator_type = fields.Str(
         required=True,
-        validate=validate.OneOf(["us", "canada", "vat"]),
+        validate=validate.OneOf(TAX_CALCULATOR_TYPES),
         error_messages={
             "required": "Calculator type is required.",
             "validator_failed": "Must be 'us', 'canada', or 'vat'."
@@ -282,18 +292,17 @@ class TaxCalculationSchema(Schema):
         load_default=0,
         validate=validate.Range(min=0, max=100)
     )
-    options = fields.Nested(TaxOptionsSchema, load_default=TaxOptionsSchema().load({}))
+    options = fields.Nested(TaxOptionsSchema, load_default=TAX_OPTIONS_DEFAULT)
 
 
 class CharacterCountSchema(Schema):
     """Schema for character count request."""
-    text = fields.Str(
-        required=True,
-        error_messages={"required": "Text is required."}
-    )
+    text = fields.Str(load_default='')
     char_limit = fields.Int(
         load_default=3532,
-        validate=validate.Range(min=1)
+        # Bodies are capped at MAX_CONTENT_LENGTH (1 MB), so no text can
+        # come near a larger limit
+        validate=validate.Range(min=1, max=1024 * 1024)
     )
 
 
@@ -301,7 +310,7 @@ class EmailTemplateSchema(Schema):
     """Schema for email template create/update."""
     title = fields.Str(
         required=True,
-        validate=validate.Length(min=1, max=200),
+        validate=validate.Length(min=1, max=100),  # email_templates.title is String(100)
         error_messages={"required": "Title is required."}
     )
     content = fields.Str(
@@ -311,14 +320,32 @@ class EmailTemplateSchema(Schema):
     )
 
 
+# ==================== Schema Instances ====================
+# Schemas hold no per-load state, so one shared instance each is reused
+# instead of constructing (and binding every field of) a schema per request.
+
+LOGIN_SCHEMA = LoginSchema()
+REGISTER_SCHEMA = RegisterSchema()
+FORGOT_PASSWORD_SCHEMA = ForgotPasswordSchema()
+RESET_PASSWORD_SCHEMA = ResetPasswordSchema()
+RESEND_VERIFICATION_SCHEMA = ResendVerificationSchema()
+VALIDATE_TOKEN_SCHEMA = ValidateTokenSchema()
+UPDATE_PROFILE_SCHEMA = UpdateProfileSchema()
+CHANGE_PASSWORD_SCHEMA = ChangePasswordSchema()
+UPDATE_EMAIL_SCHEMA = UpdateEmailSchema()
+TAX_CALCULATION_SCHEMA = TaxCalculationSchema()
+CHARACTER_COUNT_SCHEMA = CharacterCountSchema()
+EMAIL_TEMPLATE_SCHEMA = EmailTemplateSchema()
+
+
 # ==================== Validation Helper ====================
 
-def validate_request(schema_class, data):
+def validate_request(schema, data):
     """
     Validate request data against a schema.
 
     Args:
-        schema_class: Marshmallow schema class
+        schema: Marshmallow schema instance (e.g. LOGIN_SCHEMA)
         data: Dictionary of request data
 
     Returns:
@@ -326,7 +353,6 @@ def validate_request(schema_class, data):
         - If valid: (dict, None)
         - If invalid: (None, dict of errors)
     """
-    schema = schema_class()
     try:
         validated = schema.load(data)
         return validated, None
@@ -18,10 +18,15 @@ from flask import Blueprint, session
 import logging
 
 from . import (
-    api_response, api_error, get_json_body,
-    require_auth, require_verified
+    api_response, api_error, service_error, get_json_body, get_validated_json,
+    require_auth, require_verified, conditional_get
 )
-from services import get_tool_service, get_subscription_service
+from .schemas import CHARACTER_COUNT_SCHEMA, EMAIL_TEMPLATE_SCHEMA
+from services import (
+    get_tool_service, get_subscription_service,
+    get_cached_user_tools, cache_user_tools
+)
+from services.tool_service import TAX_CALCULATOR_TYPES
 
 logger = logging.getLogger(__name__)
 
@@ -42,11 +47,7 @@ def check_tool_access(tool_name):
     result = tool_service.check_tool_access(user_id, tool_name, user_role)
 
     if result.is_failure:
-        return False, api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        return False, service_error(result)
 
     if not result.data:
         return False, api_error(
@@ -60,6 +61,7 @@ def check_tool_access(tool_name):
 
 @tool_api_bp.route('/', methods=['GET'], strict_slashes=False)
 @require_auth
+@conditional_get
 def list_tools():
     """
     List all available tools with access flags.
@@ -90,40 +92,25 @@ def list_tools():
     user_role = session.get('role')
     include_inactive = request.args.get('include_inactive', 'false').lower() == 'true'
 
-    tool_service = get_tool_service()
-
-    # Get all tools
-    tools_result = tool_service.get_all_tools(include_inactive=include_inactive)
-    if tools_result.is_failure:
-        return api_error(
-            tools_result.error.code.value,
-            tools_result.error.message,
-            status_code=tools_result.error.http_status
-        )
-
-    # Get user's accessible tool names
-    user_tools_result = tool_service.get_user_tools(user_id)
-    accessible_names = {
-        t.name for t in (user_tools_result.data if user_tools_result.is_success else [])
-    }
-
-    is_admin = user_role in ['admin', 'super_admin', 'superadmin']
+    # Loaded on every dashboard visit; served from the short-lived tool list
+    # cache (no-op without Redis) when possible
+    cache_variant = f"catalog:{user_role}:{int(include_inactive)}"
+    tools_with_access = get_cached_user_tools(user_id, cache_variant)
 
-    # Resolve the user's subscription tier once for paid-tool gating
-    user_tier = None if is_admin else get_subscription_service().get_active_tier(user_id)
+    if tools_with_access is None:
+        tool_service = get_tool_service()
+        result = tool_service.get_tools_with_access(user_id, user_role, include_inactive)
 
-    # Build response with access flags
-    tools_with_access = []
-    for tool in tools_result.data:
-        has_access = is_admin or tool.name in accessible_names
+        if result.is_failure:
+            return service_error(result)
 
-        # Paid tools are also unlocked by a sufficient subscription tier
-        if not has_access and tool.is_paid and tool.required_plan_tier is not None:
-            has_access = user_tier is not None and user_tier >= tool.required_plan_tier
+        tools_with_access = []
+        for tool, has_access in result.data:
+            tool_dict = tool.to_dict()
+            tool_dict["hasAccess"] = has_access
+            tools_with_access.append(tool_dict)
 
-        tool_dict = tool.to_dict()
-        tool_dict["hasAccess"] = has_access
-        tools_with_access.append(tool_dict)
+        cache_user_tools(user_id, cache_variant, tools_with_access)
 
     return api_response({"tools": tools_with_access})
 
@@ -142,11 +129,7 @@ def list_categories():
     result = tool_service.get_categories()
 
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        return service_error(result)
 
     return api_response({"categories": result.data})
 
@@ -165,11 +148,7 @@ def list_plans():
     result = subscription_service.get_plans()
 
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        return service_error(result)
 
     return api_response({"plans": result.data})
 
@@ -215,7 +194,7 @@ def calculate_tax():
         return error
 
     calculator_type = data.get('calculator_type', 'us').lower()
-    if calculator_type not in ['us', 'canada', 'vat']:
+    if calculator_type not in TAX_CALCULATOR_TYPES:
         return api_error(
             "VALIDATION_ERROR",
             "Invalid calculator_type. Must be 'us', 'canada', or 'vat'.",
@@ -226,14 +205,10 @@ def calculate_tax():
     result = tool_service.calculate_tax(calculator_type, data)
 
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        return service_error(result)
 
     tool_service.log_usage(session.get('user_id'), "Tax Calculator")
-    logger.info(f"API Tax calculation completed for user: {session.get('username')}")
+    logger.info("API Tax calculation completed for user: %s", session.get('username'))
     return api_response(result.data)
 
 
@@ -268,36 +243,18 @@ def count_characters():
     if not has_access:
         return error
 
-    data, error = get_json_body()
+    data, error = get_validated_json(CHARACTER_COUNT_SCHEMA)
     if error:
         return error
 
-    text = data.get('text', '')
-    char_limit = data.get('char_limit', 3532)
-
-    try:
-        char_limit = int(char_limit)
-        if char_limit < 0:
-            raise ValueError("char_limit must be positive")
-    except (ValueError, TypeError):
-        return api_error(
-            "VALIDATION_ERROR",
-            "char_limit must be a positive integer.",
-            status_code=400
-        )
-
     tool_service = get_tool_service()
-    result = tool_service.count_characters(text, char_limit)
+    result = tool_service.count_characters(data['text'], data['char_limit'])
 
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        return service_error(result)
 
     tool_service.log_usage(session.get('user_id'), "Character Counter")
-    logger.info(f"API Character count completed for user: {session.get('username')}")
+    logger.info("API Character count completed for user: %s", session.get('username'))
     return api_response(result.data.to_dict())
 
 
@@ -338,11 +295,7 @@ def log_tool_usage():
     result = get_tool_service().log_usage(session.get('user_id'), tool_name)
 
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        return service_error(result)
 
     return api_response({"logged": result.data})
 
@@ -373,18 +326,13 @@ def list_email_templates():
     user_id = session.get('user_id')
 
     tool_service = get_tool_service()
-    result = tool_service.get_user_email_templates(user_id)
+    result = tool_service.get_user_email_template_dicts(user_id)
 
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        return service_error(result)
 
     tool_service.log_usage(user_id, "Email Templates")
-    templates = [t.to_dict() for t in result.data]
-    return api_response({"templates": templates})
+    return api_response({"templates": result.data})
 
 
 @tool_api_bp.route('/email-templates', methods=['POST'])
@@ -410,25 +358,21 @@ def create_email_template():
     if not has_access:
         return error
 
-    data, error = get_json_body()
+    data, error = get_validated_json(EMAIL_TEMPLATE_SCHEMA)
     if error:
         return error
 
     user_id = session.get('user_id')
-    title = data.get('title', '').strip()
-    content = data.get('content', '').strip()
+    title = data['title'].strip()
+    content = data['content'].strip()
 
     tool_service = get_tool_service()
     result = tool_service.create_email_template(user_id, title, content)
 
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        return service_error(result)
 
-    logger.info(f"API Email template created for user: {session.get('username')}")
+    logger.info("API Email template created for user: %s", session.get('username'))
     return api_response(result.data.to_dict(), status_code=201)
 
 
@@ -459,25 +403,21 @@ def update_email_template(template_id):
     if not has_access:
         return error
 
-    data, error = get_json_body()
+    data, error = get_validated_json(EMAIL_TEMPLATE_SCHEMA)
     if error:
         return error
 
     user_id = session.get('user_id')
-    title = data.get('title', '').strip()
-    content = data.get('content', '').strip()
+    title = data['title'].strip()
+    content = data['content'].strip()
 
     tool_service = get_tool_service()
     result = tool_service.update_email_template(template_id, user_id, title, content)
 
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        return service_error(result)
 
-    logger.info(f"API Email template {template_id} updated for user: {session.get('username')}")
+    logger.info("API Email template %s updated for user: %s", template_id, session.get('username'))
     return api_response(result.data.to_dict())
 
 
@@ -507,11 +447,7 @@ def delete_email_template(template_id):
     result = tool_service.delete_email_template(template_id, user_id)
 
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        return service_error(result)
 
-    logger.info(f"API Email template {template_id} deleted for user: {session.get('username')}")
+    logger.info("API Email template %s deleted for user: %s", template_id, session.get('username'))
     return '', 204
@@ -20,18 +20,25 @@ from flask import Blueprint, session, request
 import logging
 
 from . import (
-    api_response, api_error, get_json_body,
-    require_auth, require_verified
+    api_response, api_error, service_error, get_json_body,
+    require_auth, require_verified, conditional_get
+)
+from services import (
+    get_user_service, get_tool_service, get_subscription_service,
+    get_cached_user_tools, cache_user_tools
 )
-from services import get_user_service, get_tool_service, get_subscription_service
 
 logger = logging.getLogger(__name__)
 
 user_api_bp = Blueprint('user_api', __name__, url_prefix='/user')
 
+# Profile fields a user may change through PATCH /profile
+_PROFILE_FIELDS = frozenset({'name', 'fname', 'lname', 'address', 'city', 'state', 'zip'})
+
 
 @user_api_bp.route('/profile', methods=['GET'])
 @require_auth
+@conditional_get
 def get_profile():
     """
     Get current user's profile.
@@ -46,11 +53,7 @@ def get_profile():
     result = user_service.get_user_by_id(user_id)
 
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        return service_error(result)
 
     return api_response(result.data.to_dict())
 
@@ -86,8 +89,7 @@ def update_profile():
     user_id = session.get('user_id')
 
     # Extract allowed fields
-    allowed_fields = ['name', 'fname', 'lname', 'address', 'city', 'state', 'zip']
-    update_data = {k: v for k, v in data.items() if k in allowed_fields and v is not None}
+    update_data = {k: data[k] for k in _PROFILE_FIELDS & data.keys() if data[k] is not None}
 
     # Map 'zip' to 'zip_code' for service
     if 'zip' in update_data:
@@ -104,13 +106,9 @@ def update_profile():
     result = user_service.update_profile(user_id, **update_data)
 
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        return service_error(result)
 
-    logger.info(f"API Profile updated for user ID: {user_id}")
+    logger.info("API Profile updated for user ID: %s", user_id)
     return api_response(result.data.to_dict())
 
 
@@ -153,14 +151,9 @@ def change_password():
     )
 
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status,
-            details=result.error.details
-        )
+        return service_error(result)
 
-    logger.info(f"API Password changed for user ID: {user_id}")
+    logger.info("API Password changed for user ID: %s", user_id)
     return api_response({
         "message": "Password changed successfully."
     })
@@ -205,16 +198,12 @@ def update_email():
     )
 
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        return service_error(result)
 
     # Update session email
     session['email'] = new_email.lower()
 
-    logger.info(f"API Email updated for user ID: {user_id}")
+    logger.info("API Email updated for user ID: %s", user_id)
     return api_response({
         "message": "Email updated successfully. Please verify your new email address.",
         "requiresVerification": True
@@ -223,6 +212,7 @@ def update_email():
 
 @user_api_bp.route('/tools', methods=['GET'])
 @require_auth
+@conditional_get
 def get_user_tools():
     """
     Get list of tools the current user has access to.
@@ -232,19 +222,18 @@ def get_user_tools():
         401: Not authenticated
     """
     user_id = session.get('user_id')
+    tool_names = get_cached_user_tools(user_id, "names")
 
-    tool_service = get_tool_service()
-    result = tool_service.get_user_tools(user_id)
+    if tool_names is None:
+        tool_service = get_tool_service()
+        result = tool_service.get_user_tools(user_id)
 
-    if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        if result.is_failure:
+            return service_error(result)
 
-    # Extract tool names from ToolInfo objects
-    tool_names = [tool.name for tool in result.data]
+        # Extract tool names from ToolInfo objects
+        tool_names = [tool.name for tool in result.data]
+        cache_user_tools(user_id, "names", tool_names)
 
     return api_response({
         "tools": tool_names
@@ -267,11 +256,7 @@ def get_usage_stats():
     result = user_service.get_dashboard_data(user_id)
 
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        return service_error(result)
 
     return api_response({
         "usage": result.data.usage_stats or {}
@@ -309,11 +294,7 @@ def get_usage_history():
     result = tool_service.get_usage_history(user_id, limit=limit, offset=offset)
 
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        return service_error(result)
 
     return api_response(result.data)
 
@@ -334,11 +315,7 @@ def get_subscription():
     result = subscription_service.get_user_subscription(user_id)
 
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        return service_error(result)
 
     return api_response({"subscription": result.data})
 
@@ -359,11 +336,7 @@ def get_favorites():
     result = tool_service.get_user_favorites(user_id)
 
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        return service_error(result)
 
     return api_response({
         "favorites": result.data
@@ -391,14 +364,9 @@ def add_favorite(tool_id):
     result = tool_service.add_favorite(user_id, tool_id)
 
     if result.is_failure:
-        status = result.error.http_status
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=status
-        )
+        return service_error(result)
 
-    logger.info(f"API Favorite added: user_id={user_id}, tool_id={tool_id}")
+    logger.info("API Favorite added: user_id=%s, tool_id=%s", user_id, tool_id)
     return api_response({"message": "Favorite added."}, status_code=201)
 
 
@@ -422,17 +390,14 @@ def remove_favorite(tool_id):
     result = tool_service.remove_favorite(user_id, tool_id)
 
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        return service_error(result)
 
-    logger.info(f"API Favorite removed: user_id={user_id}, tool_id={tool_id}")
+    logger.info("API Favorite removed: user_id=%s, tool_id=%s", user_id, tool_id)
     return '', 204
 
 @user_api_bp.route('/dashboard', methods=['GET'])
 @require_auth
+@conditional_get
 def get_dashboard():
     """
     Get all dashboard data in a single request.
@@ -456,11 +421,7 @@ def get_dashboard():
     result = user_service.get_dashboard_data(user_id)
 
     if result.is_failure:
-        return api_error(
-            result.error.code.value,
-            result.error.message,
-            status_code=result.error.http_status
-        )
+        return service_error(result)
 
     tool_service = get_tool_service()
     favorites_result = tool_service.get_user_favorites(user_id)
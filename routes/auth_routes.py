@@ -15,12 +15,14 @@ Routes:
 - /reset_password/<token> - Reset password with token
 """
 
-from flask import Blueprint, request, redirect, url_for, render_template, session, flash
+from flask import Blueprint, request, redirect, url_for, render_template, session, flash, current_app
+from flask_limiter import RateLimitExceeded
 from functools import wraps
 import logging
 
 from config.auth_config import AuthConfig
 from services import get_auth_service, ErrorCode
+from utils.rate_limit import limiter
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -35,7 +37,7 @@ def login_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
         if not session.get('logged_in'):
-            logger.warning(f"Unauthorized access attempt to {request.endpoint} from IP: {request.remote_addr}")
+            logger.warning("Unauthorized access attempt to %s from IP: %s", request.endpoint, request.remote_addr)
             flash('Please log in to access this page.', 'error')
             return redirect(url_for("auth.login"))
         return f(*args, **kwargs)
@@ -49,14 +51,8 @@ def anonymous_required(f):
         if session.get('logged_in'):
             username = session.get('username', 'unknown')
             user_role = session.get('role', 'user')
-            logger.info(f"Already logged in user '{username}' ({user_role}) redirected from {request.endpoint}")
-
-            if user_role == 'super_admin':
-                return redirect(url_for('admin.superadmin_dashboard'))
-            elif user_role == 'admin':
-                return redirect(url_for('admin.admin_dashboard'))
-            else:
-                return redirect(url_for('user.user_dashboard'))
+            logger.info("Already logged in user '%s' (%s) redirected from %s", username, user_role, request.endpoint)
+            return redirect(_get_redirect_route(user_role))
         return f(*args, **kwargs)
     return decorated_function
 
@@ -64,27 +60,61 @@ def anonymous_required(f):
 # ==================== Helper Functions ====================
 
 def _get_client_ip():
-    """Get client IP address from request."""
-    return request.environ.get('HTTP_X_FORWARDED_FOR', request.remote_addr)
+    """Get client IP address from request (already resolved from X-Forwarded-For by ProxyFix)."""
+    return request.remote_addr
+
+
+def _form_value(key, lower=False):
+    """Get a stripped (optionally lowercased) text field from the submitted form."""
+    value = request.form.get(key, "").strip()
+    return value.lower() if lower else value
+
+
+# Per-account keys complement the per-IP limits so rotating IPs doesn't
+# reset the count for the account being targeted.
+def _login_account_key():
+    """Rate limit key for the username a login attempt targets."""
+    username = _form_value("username", lower=True)
+    return f"account:{username}" if username else _get_client_ip()
+
+
+def _reset_account_key():
+    """Rate limit key for the email a password reset is requested for."""
+    email = _form_value("email", lower=True)
+    return f"account:{email}" if email else _get_client_ip()
+
+
+def _pending_verification_key():
+    """Rate limit key for the email awaiting verification in this session."""
+    email = session.get('pending_verification_email')
+    return f"account:{email.lower()}" if email else _get_client_ip()
 
 
 def _set_user_session(user_profile):
     """Set up user session after successful login/verification."""
-    session["logged_in"] = True
-    session["username"] = user_profile.username
-    session["role"] = user_profile.role
-    session["user_id"] = user_profile.id
-    session["user_tools"] = user_profile.tools
+    session.update({
+        "logged_in": True,
+        "username": user_profile.username,
+        "role": user_profile.role,
+        "user_id": user_profile.id,
+    })
+    # Prevent session fixation: server-side (Redis) sessions need a new id
+    # once they carry an identity. Flask-Session skips empty sessions, so
+    # this runs after the keys are written.
+    if hasattr(current_app.session_interface, 'regenerate'):
+        current_app.session_interface.regenerate(session)
+
+
+# Dashboard endpoint per role; everyone else lands on the user dashboard
+_ROLE_DASHBOARDS = {
+    "super_admin": "admin.superadmin_dashboard",
+    "admin": "admin.admin_dashboard",
+}
 
 
 def _get_redirect_route(role):
     """Get the appropriate redirect route based on user role."""
-    if role == "super_admin":
-        return url_for("admin.superadmin_dashboard")
-    elif role == "admin":
-        return url_for("admin.admin_dashboard")
-    else:
-        return url_for("user.user_dashboard")
+    return url_for(_ROLE_DASHBOARDS.get(role, "user.user_dashboard"))
 
 
 def _render_login_page(error_message=None):
@@ -111,9 +141,29 @@ def _render_register_page(error_message=None, form_data=None):
     )
 
 
+# ==================== Error Handlers ====================
+
+@auth.errorhandler(RateLimitExceeded)
+def handle_rate_limited(e):
+    """Show rate limit rejections as a flash message instead of a bare 429 page."""
+    logger.warning("Rate limit exceeded: %s %s (%s) from IP: %s", request.method, request.path, e.description, _get_client_ip())
+    message = "Too many attempts. Please wait a moment and try again."
+
+    if request.endpoint == "auth.resend_verification":
+        flash(message, "error")
+        return redirect(url_for("auth.verification_pending"))
+
+    if request.endpoint == "auth.register":
+        return _render_register_page(message), 429
+
+    return _render_login_page(message), 429
+
+
 # ==================== Routes ====================
 
 @auth.route("/login", methods=["GET", "POST"])
+@limiter.limit("10 per minute", methods=["POST"])
+@limiter.limit("5 per minute;20 per hour", key_func=_login_account_key, methods=["POST"])
 @anonymous_required
 def login():
     """
@@ -124,14 +174,14 @@ def login():
     client_ip = _get_client_ip()
 
     if request.method == "GET":
-        logger.info(f"Login page accessed from IP: {client_ip}")
+        logger.info("Login page accessed from IP: %s", client_ip)
         session.pop('_flashes', None)  # Clear flash messages for GET
         return _render_login_page()
 
     # POST request - process login
-    logger.info(f"Login attempt initiated from IP: {client_ip}")
+    logger.debug("Login attempt initiated from IP: %s", client_ip)
 
-    username = request.form.get("username", "").strip()
+    username = _form_value("username")
     password = request.form.get("password", "")
     recaptcha_response = request.form.get("g-recaptcha-response", "")
 
@@ -161,7 +211,7 @@ def login():
     login_result = result.data
     _set_user_session(login_result.user)
 
-    logger.info(f"LOGIN SUCCESS: User '{username}' logged in from IP: {client_ip}")
+    logger.info("LOGIN SUCCESS: User '%s' logged in from IP: %s", username, client_ip)
     return redirect(_get_redirect_route(login_result.user.role))
 
 
@@ -172,7 +222,7 @@ def verify_email(token):
     Automatically logs user in after successful verification.
     """
     client_ip = _get_client_ip()
-    logger.info(f"Email verification attempted from IP: {client_ip}")
+    logger.info("Email verification attempted from IP: %s", client_ip)
 
     auth_service = get_auth_service()
     result = auth_service.verify_email(token)
@@ -195,7 +245,7 @@ def verify_email(token):
     # Set up session (auto-login)
     _set_user_session(user_profile)
 
-    logger.info(f"EMAIL VERIFICATION + AUTO-LOGIN SUCCESS: User '{user_profile.username}' from IP: {client_ip}")
+    logger.info("EMAIL VERIFICATION + AUTO-LOGIN SUCCESS: User '%s' from IP: %s", user_profile.username, client_ip)
     flash("Email verified successfully! Welcome to OmniTools!", "success")
 
     return redirect(_get_redirect_route(user_profile.role))
@@ -205,7 +255,7 @@ def verify_email(token):
 def verification_pending():
     """Show verification pending page after registration."""
     client_ip = _get_client_ip()
-    logger.info(f"Verification pending page accessed from IP: {client_ip}")
+    logger.info("Verification pending page accessed from IP: %s", client_ip)
 
     user_email = session.get('pending_verification_email')
     user_name = session.get('pending_verification_name')
@@ -215,7 +265,7 @@ def verification_pending():
         flash("Registration session expired. Please register again.", "error")
         return redirect(url_for("auth.register"))
 
-    logger.info(f"Showing verification pending page for: {user_email}")
+    logger.info("Showing verification pending page for: %s", user_email)
     return render_template(
         "auth/verification_pending.html",
         email=user_email,
@@ -224,10 +274,12 @@ def verification_pending():
 
 
 @auth.route("/resend_verification", methods=["POST"])
+@limiter.limit("3 per minute")
+@limiter.limit("1 per minute;5 per day", key_func=_pending_verification_key)
 def resend_verification():
     """Resend email verification."""
     client_ip = _get_client_ip()
-    logger.info(f"Resend verification request from IP: {client_ip}")
+    logger.info("Resend verification request from IP: %s", client_ip)
 
     email = session.get('pending_verification_email')
     if not email:
@@ -246,7 +298,7 @@ def resend_verification():
             return redirect(url_for("auth.register"))
 
         # Already verified case
-        if error.code == ErrorCode.VALIDATION_ERROR and "already verified" in error.message.lower():
+        if error.code == ErrorCode.AUTH_ALREADY_VERIFIED:
             flash(error.message, "success")
             return redirect(url_for("auth.login"))
 
@@ -258,6 +310,7 @@ def resend_verification():
 
 
 @auth.route("/register", methods=["GET", "POST"])
+@limiter.limit("5 per hour", methods=["POST"])
 @anonymous_required
 def register():
     """
@@ -268,16 +321,16 @@ def register():
     client_ip = _get_client_ip()
 
     if request.method == "GET":
-        logger.info(f"Registration page accessed from IP: {client_ip}")
+        logger.info("Registration page accessed from IP: %s", client_ip)
         return _render_register_page()
 
     # POST request - process registration
-    logger.info(f"Registration attempt initiated from IP: {client_ip}")
+    logger.info("Registration attempt initiated from IP: %s", client_ip)
 
     # Get form data
-    name = request.form.get('name', '').strip()
-    username = request.form.get('username', '').strip()
-    email = request.form.get('email', '').strip().lower()
+    name = _form_value('name')
+    username = _form_value('username')
+    email = _form_value('email', lower=True)
     password = request.form.get('password', '')
     confirm_password = request.form.get('confirm_password', '')
     recaptcha_response = request.form.get('g-recaptcha-response', '')
@@ -304,7 +357,7 @@ def register():
     session['pending_verification_email'] = reg_result.email
     session['pending_verification_name'] = reg_result.name
 
-    logger.info(f"REGISTRATION SUCCESS: User '{username}' ({email}) registered from IP: {client_ip}")
+    logger.info("REGISTRATION SUCCESS: User '%s' (%s) registered from IP: %s", username, email, client_ip)
 
     if not reg_result.verification_email_sent:
         flash("Registration successful, but we couldn't send the verification email. Please contact support.", "warning")
@@ -319,27 +372,28 @@ def logout():
     username = session.get('username', 'unknown')
     client_ip = _get_client_ip()
 
-    logger.info(f"Logout initiated for user: '{username}' from IP: {client_ip}")
+    logger.info("Logout initiated for user: '%s' from IP: %s", username, client_ip)
 
-    session.clear()
-    session.pop('_flashes', None)
+    session.clear()  # also drops any pending flash messages
 
-    logger.info(f"LOGOUT SUCCESS: User '{username}' logged out successfully")
+    logger.info("LOGOUT SUCCESS: User '%s' logged out successfully", username)
     return redirect(url_for("auth.login"))
 
 
 @auth.route("/forgot_password", methods=["GET", "POST"])
+@limiter.limit("3 per minute", methods=["POST"])
+@limiter.limit("3 per hour", key_func=_reset_account_key, methods=["POST"])
 def forgot_password():
     """Handle password reset requests."""
     client_ip = _get_client_ip()
 
     if request.method == "GET":
-        logger.info(f"Forgot password page accessed from IP: {client_ip}")
+        logger.info("Forgot password page accessed from IP: %s", client_ip)
         return render_template("forgot_password_request.html")
 
-    logger.info(f"Password reset request initiated from IP: {client_ip}")
+    logger.info("Password reset request initiated from IP: %s", client_ip)
 
-    email = request.form.get("email", "").strip()
+    email = _form_value("email")
 
     auth_service = get_auth_service()
     auth_service.request_password_reset(email)
@@ -350,10 +404,11 @@ def forgot_password():
 
 
 @auth.route("/reset_password/<token>", methods=["GET", "POST"])
+@limiter.limit("10 per minute", methods=["POST"])
 def reset_password(token):
     """Handle password reset."""
     client_ip = _get_client_ip()
-    logger.info(f"Password reset page accessed from IP: {client_ip}")
+    logger.info("Password reset page accessed from IP: %s", client_ip)
 
     auth_service = get_auth_service()
 
@@ -364,11 +419,11 @@ def reset_password(token):
         return redirect(url_for("auth.login"))
 
     if request.method == "GET":
-        logger.info(f"Showing password reset form for: {token_result.data}")
+        logger.info("Showing password reset form for: %s", token_result.data)
         return render_template("reset_password.html", token=token)
 
     # POST - process password reset
-    logger.info(f"Processing password reset for email: '{token_result.data}'")
+    logger.info("Processing password reset for email: '%s'", token_result.data)
 
     password = request.form.get("password", "")
     confirm_password = request.form.get("confirm_password", "")
@@ -383,7 +438,7 @@ def reset_password(token):
         flash(result.error.message, "error")
         return render_template("reset_password.html", token=token)
 
-    logger.info(f"PASSWORD RESET SUCCESS from IP: {client_ip}")
+    logger.info("PASSWORD RESET SUCCESS from IP: %s", client_ip)
     flash("Password reset successful! You can now log in.", "success")
     return redirect(url_for("auth.login"))
 
@@ -362,8 +362,6 @@ def grant_tool_access():
                 new_access = ToolAccess(user_id=user_id, tool_name=tool_name)
                 db.session.add(new_access)
                 db.session.commit()
-                if "user_tools" in session:
-                    del session["user_tools"]  # Clear the session to force a refresh
                 flash(f"Tool access granted for {tool_name} to {user.username}", "success")
             else:
                 flash(f"User already has access to {tool_name}", "info")
@@ -384,8 +382,6 @@ def revoke_tool_access():
         if tool_access:
             db.session.delete(tool_access)
             db.session.commit()
-            if "user_tools" in session:
-                del session["user_tools"]  # Clear the session to force a refresh
             flash(f"Tool access revoked for {tool_name}", "success")
         else:
             flash(f"User doesn't have access to {tool_name}", "info")
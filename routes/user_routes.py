@@ -39,7 +39,6 @@ def user_dashboard():
     if user:
         user_tools = [access.tool_name for access in ToolAccess.query.filter_by(user_id=user.id).all()]
         logging.debug(f"User tools: {user_tools}")
-        session["user_tools"] = user_tools  # Update session
         return render_template("user_dashboard.html", user=user, user_tools=user_tools)
     else:
         logging.error(f"User not found for username: {username}")
@@ -150,6 +150,11 @@ def import_tool_access(source_path, mode='merge', dry_run=False, confirmed=False
                 else:
                     logger.info(f"[DRY RUN] Would delete {ToolAccess.query.count()} existing records")
 
+            # Load existing grants once rather than querying per imported grant
+            existing_grants = set(
+                db.session.query(ToolAccess.user_id, ToolAccess.tool_name).all()
+            )
+
             # Process imports
             logger.info(f"\nProcessing {len(import_data['tool_access'])} grants from import...")
 
@@ -174,17 +179,14 @@ def import_tool_access(source_path, mode='merge', dry_run=False, confirmed=False
                     continue
 
                 # Check if grant already exists (idempotent)
-                existing_grant = ToolAccess.query.filter_by(
-                    user_id=target_user_id,
-                    tool_name=tool_name
-                ).first()
-
-                if existing_grant:
+                grant_key = (target_user_id, tool_name)
+                if grant_key in existing_grants:
                     stats['grants_skipped'] += 1
                     logger.debug(f"Skipping existing grant: {username} -> {tool_name}")
                     continue
 
                 # Create new grant
+                existing_grants.add(grant_key)
                 stats['grants_created'] += 1
                 logger.info(f"Creating grant: {username} ({email}) -> {tool_name}")
 
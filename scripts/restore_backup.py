@@ -15,6 +15,80 @@ if sys.platform == 'win32':
 BACKUP_DB = r"zzDumpfiles\SQLite Database Backup\users.db"
 CURRENT_DB = r"instance\users.db"
 
+# Bulk-load settings for the restore connection. backup_current_db() snapshots
+# the target first, so relaxed durability for this one-shot write is safe.
+# journal_mode is left alone: it persists in the database file, unlike these.
+BULK_LOAD_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA locking_mode=EXCLUSIVE",
+)
+
+# Columns that are not copied verbatim from the backup, per table
+COLUMN_EXPRESSIONS = {
+    'users': {
+        # If name is NULL or empty, compute it from fname and lname
+        'name': "COALESCE(NULLIF(name, ''), IFNULL(fname, '') || ' ' || IFNULL(lname, ''))",
+    },
+}
+
+# Tables written by the restore; their secondary indexes are rebuilt once
+# after the bulk load instead of being maintained row by row
+RESTORED_TABLES = ('users', 'admins', 'super_admins', 'tool_access', 'email_templates')
+
+def _prepare_insert(cursor, table, cache):
+    """Build the upsert copying a table from the attached backup, memoised in cache by table name"""
+    if table in cache:
+        return cache[table]
+
+    cursor.execute(f"PRAGMA bak.table_info({table})")
+    backup_columns = [col[1] for col in cursor.fetchall()]
+
+    cursor.execute(f"PRAGMA main.table_info({table})")
+    current_columns = {col[1] for col in cursor.fetchall()}
+
+    # Only copy the columns that exist in both schemas
+    columns = [col for col in backup_columns if col in current_columns]
+    expressions = COLUMN_EXPRESSIONS.get(table, {})
+    select_list = ','.join(expressions.get(col, col) for col in columns)
+
+    # An upsert on id can't resolve a clash on another UNIQUE column (e.g. a
+    # username now held by a different id), so those tables keep INSERT OR
+    # REPLACE and the backup row wins, as it always did
+    cursor.execute(f"PRAGMA main.index_list({table})")
+    has_secondary_unique = any(index[2] and index[3] != 'pk' for index in cursor.fetchall())
+
+    if has_secondary_unique:
+        sql = f"INSERT OR REPLACE INTO {table} ({','.join(columns)}) SELECT {select_list} FROM bak.{table}"
+    else:
+        # Upsert on the primary key instead of INSERT OR REPLACE, which deletes
+        # and re-inserts existing rows. "WHERE true" is required by SQLite's
+        # parser when an upsert follows INSERT ... SELECT.
+        updates = ','.join(f"{col}=excluded.{col}" for col in columns if col != 'id')
+        sql = (
+            f"INSERT INTO {table} ({','.join(columns)}) SELECT {select_list} FROM bak.{table} WHERE true "
+            f"ON CONFLICT(id) DO UPDATE SET {updates}"
+        )
+    cache[table] = sql
+    return sql
+
+def _drop_indexes(cursor, tables):
+    """Drop the explicit indexes on tables, returning their DDL for recreation"""
+    placeholders = ','.join('?' * len(tables))
+    # Indexes backing UNIQUE/PRIMARY KEY constraints have no sql and can't be
+    # dropped; explicit unique indexes stay so they keep enforcing uniqueness
+    cursor.execute(
+        f"SELECT name, sql FROM main.sqlite_master "
+        f"WHERE type = 'index' AND sql IS NOT NULL AND sql NOT LIKE 'CREATE UNIQUE%' "
+        f"AND tbl_name IN ({placeholders})",
+        tables
+    )
+    indexes = cursor.fetchall()
+    for name, _ in indexes:
+        cursor.execute(f'DROP INDEX main."{name}"')
+    return [sql for _, sql in indexes]
+
 def backup_current_db():
     """Backup the current database before restoration"""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -37,42 +111,33 @@ def restore_data():
     # Backup current database first
     backup_current_db()
 
-    # Connect to both databases
-    backup_conn = sqlite3.connect(BACKUP_DB)
+    # Connect to the target database; the backup is read through ATTACH
     current_conn = sqlite3.connect(CURRENT_DB)
 
-    backup_cursor = backup_conn.cursor()
+    for pragma in BULK_LOAD_PRAGMAS:
+        current_conn.execute(pragma)
+
+    # Attach the backup so table copies can run as INSERT ... SELECT inside
+    # SQLite. Must happen before the first write opens a transaction.
+    current_conn.execute("ATTACH DATABASE ? AS bak", (BACKUP_DB,))
+
     current_cursor = current_conn.cursor()
+    insert_sql = {}
 
     try:
+        # sqlite3 only opens a transaction implicitly before DML, so each
+        # DROP INDEX would otherwise commit on its own. Begin explicitly so a
+        # rollback also brings the dropped indexes back.
+        current_conn.execute("BEGIN")
+        index_ddl = _drop_indexes(current_cursor, RESTORED_TABLES)
+
         # 1. Restore Users
         print("\n[1/4] Restoring users...")
-        backup_cursor.execute("SELECT * FROM users")
-        users = backup_cursor.fetchall()
-
-        # Get column names from backup
-        backup_cursor.execute("PRAGMA table_info(users)")
-        columns = [col[1] for col in backup_cursor.fetchall()]
 
-        # Find indices for fname, lname, and name
-        fname_idx = columns.index('fname')
-        lname_idx = columns.index('lname')
-        name_idx = columns.index('name')
+        users_sql = _prepare_insert(current_cursor, 'users', insert_sql)
+        current_cursor.execute(users_sql)
 
-        placeholders = ','.join(['?'] * len(columns))
-        column_names = ','.join(columns)
-
-        for user in users:
-            # Convert to list so we can modify it
-            user_list = list(user)
-
-            # If name is NULL or empty, compute it from fname and lname
-            if not user_list[name_idx]:
-                user_list[name_idx] = f"{user_list[fname_idx]} {user_list[lname_idx]}"
-
-            current_cursor.execute(f"INSERT OR REPLACE INTO users ({column_names}) VALUES ({placeholders})", user_list)
-
-        print(f"  ✓ Restored {len(users)} users")
+        print(f"  ✓ Restored {current_cursor.rowcount} users")
 
         # 2. Restore Admins (now using Single Table Inheritance)
         print("\n[2/4] Restoring admin references...")
@@ -80,46 +145,40 @@ def restore_data():
         # Admins are identified by role='admin' in users table, which was already restored
         # We need to create admin table entries matching user IDs where role='admin'
 
-        current_cursor.execute("SELECT id FROM users WHERE role IN ('admin', 'super_admin')")
-        admin_user_ids = [row[0] for row in current_cursor.fetchall()]
+        # Fetch id and role together so each admin doesn't need its own role lookup
+        current_cursor.execute("SELECT id, role FROM users WHERE role IN ('admin', 'super_admin')")
+        admin_users = current_cursor.fetchall()
 
-        for user_id in admin_user_ids:
-            # Check if this is admin or super_admin
-            current_cursor.execute("SELECT role FROM users WHERE id=?", (user_id,))
-            role = current_cursor.fetchone()[0]
+        # Every admin/super_admin gets an admins row; super_admins additionally
+        # get a super_admins row. Build both id lists up front and insert in bulk.
+        admin_ids = [(user_id,) for user_id, _ in admin_users]
+        super_admin_ids = [(user_id,) for user_id, role in admin_users if role == 'super_admin']
 
-            if role == 'admin':
-                # Insert into admins table (only id field exists now)
-                current_cursor.execute("INSERT OR IGNORE INTO admins (id) VALUES (?)", (user_id,))
-            elif role == 'super_admin':
-                # Insert into both admins and super_admins
-                current_cursor.execute("INSERT OR IGNORE INTO admins (id) VALUES (?)", (user_id,))
-                current_cursor.execute("INSERT OR IGNORE INTO super_admins (id) VALUES (?)", (user_id,))
+        current_cursor.executemany("INSERT OR IGNORE INTO admins (id) VALUES (?)", admin_ids)
+        current_cursor.executemany("INSERT OR IGNORE INTO super_admins (id) VALUES (?)", super_admin_ids)
 
-        print(f"  ✓ Created {len(admin_user_ids)} admin/super_admin table entries")
+        print(f"  ✓ Created {len(admin_users)} admin/super_admin table entries")
 
         # 3. No separate super admin restoration needed (handled above)
 
         # 4. Restore Tool Access (only if tool exists)
         print("\n[4/4] Restoring tool access...")
 
-        # Get valid tool names from current DB
-        current_cursor.execute("SELECT name FROM tools")
-        valid_tools = {row[0] for row in current_cursor.fetchall()}
-
-        backup_cursor.execute("SELECT user_id, tool_name FROM tool_access")
-        tool_accesses = backup_cursor.fetchall()
-
-        restored = 0
-        skipped = 0
-
-        for user_id, tool_name in tool_accesses:
-            if tool_name in valid_tools:
-                current_cursor.execute("INSERT OR REPLACE INTO tool_access (user_id, tool_name) VALUES (?, ?)",
-                                     (user_id, tool_name))
-                restored += 1
-            else:
-                skipped += 1
+        # Only restore access for tools that still exist in the current DB;
+        # the join against tools does the filtering inside SQLite.
+        current_cursor.execute(
+            "SELECT COUNT(*) FROM bak.tool_access WHERE tool_name NOT IN (SELECT name FROM tools)"
+        )
+        skipped = current_cursor.fetchone()[0]
+
+        # tool_access has no unique (user_id, tool_name) constraint to upsert
+        # on, so skip grants the current DB already has explicitly
+        current_cursor.execute(
+            "INSERT INTO tool_access (user_id, tool_name) "
+            "SELECT DISTINCT b.user_id, b.tool_name FROM bak.tool_access b JOIN tools t ON t.name = b.tool_name "
+            "WHERE NOT EXISTS (SELECT 1 FROM tool_access a WHERE a.user_id = b.user_id AND a.tool_name = b.tool_name)"
+        )
+        restored = current_cursor.rowcount
 
         print(f"  ✓ Restored {restored} tool access records")
         if skipped > 0:
@@ -127,35 +186,20 @@ def restore_data():
 
         # 5. Restore Email Templates
         print("\n[5/5] Restoring email templates...")
-        backup_cursor.execute("SELECT * FROM email_templates")
-        templates = backup_cursor.fetchall()
-
-        if templates:
-            # Get column names from both databases
-            backup_cursor.execute("PRAGMA table_info(email_templates)")
-            backup_columns = [col[1] for col in backup_cursor.fetchall()]
-
-            current_cursor.execute("PRAGMA table_info(email_templates)")
-            current_columns = [col[1] for col in current_cursor.fetchall()]
-
-            # Find common columns
-            common_columns = [col for col in backup_columns if col in current_columns]
+        templates_sql = _prepare_insert(current_cursor, 'email_templates', insert_sql)
+        current_cursor.execute(templates_sql)
+        restored_templates = current_cursor.rowcount
 
-            # Get indices of common columns in backup
-            backup_indices = [backup_columns.index(col) for col in common_columns]
-
-            placeholders = ','.join(['?'] * len(common_columns))
-            column_names = ','.join(common_columns)
-
-            for template in templates:
-                # Extract only the columns that exist in both schemas
-                values = [template[idx] for idx in backup_indices]
-                current_cursor.execute(f"INSERT OR REPLACE INTO email_templates ({column_names}) VALUES ({placeholders})", values)
-
-            print(f"  ✓ Restored {len(templates)} email templates")
+        if restored_templates:
+            print(f"  ✓ Restored {restored_templates} email templates")
         else:
             print("  ℹ No email templates to restore")
 
+        # Rebuild the dropped indexes in the same transaction, so a failure
+        # here rolls back with the data rather than leaving them missing
+        for sql in index_ddl:
+            current_cursor.execute(sql)
+
         # Commit all changes
         current_conn.commit()
 
@@ -186,7 +230,6 @@ def restore_data():
         return False
 
     finally:
-        backup_conn.close()
         current_conn.close()
 
 if __name__ == "__main__":
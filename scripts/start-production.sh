@@ -14,13 +14,16 @@ echo "=========================================="
 
 # Configuration
 FLASK_PORT=5000
-FLASK_WORKERS=2
+FLASK_WORKERS=${FLASK_WORKERS:-2}
+# Threads per worker (gthread): requests waiting on the DB/Redis don't block
+# the rest; keep at or below DB_POOL_SIZE so each thread can get a connection
+FLASK_THREADS=${FLASK_THREADS:-4}
 FLASK_TIMEOUT=120
 STARTUP_TIMEOUT=60
 
 # Start Flask (Gunicorn) in background
 echo "Starting Flask on port $FLASK_PORT..."
-gunicorn -b 127.0.0.1:$FLASK_PORT -w $FLASK_WORKERS --timeout $FLASK_TIMEOUT "main:create_app()" &
+gunicorn -b 127.0.0.1:$FLASK_PORT -w $FLASK_WORKERS --threads $FLASK_THREADS --timeout $FLASK_TIMEOUT "main:create_app()" &
 FLASK_PID=$!
 
 echo "Flask PID: $FLASK_PID"
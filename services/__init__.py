@@ -10,6 +10,10 @@ from .user_service import UserService, get_user_service, UserProfileData, Dashbo
 from .tool_service import ToolService, get_tool_service, ToolInfo, EmailTemplateData
 from .subscription_service import SubscriptionService, get_subscription_service
 from .admin_service import AdminService, get_admin_service, AdminUserData
+from .user_cache import (
+    get_cached_user_profile, cache_user_profile, invalidate_user_cache,
+    get_cached_user_tools, cache_user_tools, invalidate_tool_catalog
+)
 
 __all__ = [
     # Base classes and utilities
@@ -54,4 +58,12 @@ __all__ = [
     'AdminService',
     'get_admin_service',
     'AdminUserData',
+
+    # User Cache
+    'get_cached_user_profile',
+    'cache_user_profile',
+    'invalidate_user_cache',
+    'get_cached_user_tools',
+    'cache_user_tools',
+    'invalidate_tool_catalog',
 ]
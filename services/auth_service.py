@@ -16,13 +16,15 @@ will use. Routes handle HTTP concerns, this service handles business logic.
 import os
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 from datetime import datetime
 
-from sqlalchemy import text
+from sqlalchemy import or_, text
 
-from model import User, db, UserFactory
+from model import User, db, UserFactory, BcryptPasswordHasher
 from config.auth_config import AuthConfig
 from .base import BaseService, ServiceResult, ErrorCode
 from .token_service import get_token_service, TokenService
@@ -30,6 +32,23 @@ from .email_service import get_email_service, EmailService
 
 logger = logging.getLogger(__name__)
 
+# Keeps the TLS connection to Google's verify endpoint alive between
+# captcha checks instead of handshaking on every login/registration.
+# Only failed connects are retried: the POST itself is never resent.
+_recaptcha_http = requests.Session()
+_recaptcha_http.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=10,
+    max_retries=Retry(total=1, read=0, backoff_factor=0.1),
+))
+
+# (connect, read) seconds; bounds how long a slow Google holds a worker thread
+RECAPTCHA_TIMEOUT = (1.5, 3.0)
+
+# Bcrypt hash (default cost) of a random, discarded password. Checked on
+# logins for unknown usernames so they take as long as a wrong password.
+_DUMMY_PASSWORD_HASH = "$2b$12$jSb/zbl4WJW7UDbe53VtsOlGRIUkHgFk2QgZ45.ZRdibLX9d0MjTC"
+
 
 @dataclass
 class UserProfile:
@@ -130,7 +149,7 @@ class AuthService(BaseService):
         """
         # Skip if captcha is disabled
         if not AuthConfig.is_captcha_enabled():
-            self.logger.info("Captcha verification skipped - captcha disabled")
+            self.logger.debug("Captcha verification skipped - captcha disabled")
             return ServiceResult.success(True)
 
         if not recaptcha_response:
@@ -148,16 +167,16 @@ class AuthService(BaseService):
             if remote_ip:
                 data["remoteip"] = remote_ip
 
-            self.logger.info("Sending captcha verification request to Google")
-            response = requests.post(
+            self.logger.debug("Sending captcha verification request to Google")
+            response = _recaptcha_http.post(
                 AuthConfig.RECAPTCHA_VERIFY_URL,
                 data=data,
-                timeout=5
+                timeout=RECAPTCHA_TIMEOUT
             )
             result = response.json()
 
             if result.get("success", False):
-                self.logger.info("Captcha verification successful")
+                self.logger.debug("Captcha verification successful")
                 return ServiceResult.success(True)
             else:
                 error_codes = result.get("error-codes", [])
@@ -167,6 +186,13 @@ class AuthService(BaseService):
                     "Captcha verification failed. Please try again."
                 )
 
+        except requests.Timeout as e:
+            self.logger.warning(f"Captcha verification timed out - Google did not answer in time: {e}")
+            return ServiceResult.failure(
+                ErrorCode.RECAPTCHA_FAILED,
+                "Captcha verification failed. Please try again."
+            )
+
         except Exception as e:
             self._log_error("verify_recaptcha", e)
             return ServiceResult.failure(
@@ -198,8 +224,8 @@ class AuthService(BaseService):
 
             db_email_verified = bool(result[0])
 
-            self.logger.info(
-                f"Email verification status for {user.username}: {db_email_verified}"
+            self.logger.debug(
+                "Email verification status for %s: %s", user.username, db_email_verified
             )
 
             # Sync the user object with database state
@@ -258,6 +284,8 @@ class AuthService(BaseService):
         user = User.query.filter_by(username=username).first()
 
         if not user:
+            # Same bcrypt cost as a real check, so timing doesn't reveal the username is unknown
+            BcryptPasswordHasher().check_password(password, _DUMMY_PASSWORD_HASH)
             self.logger.warning(f"Login failed - user not found: '{username}'")
             return ServiceResult.failure(
                 ErrorCode.AUTH_INVALID_CREDENTIALS,
@@ -281,10 +309,10 @@ class AuthService(BaseService):
                 details={"email": user.email, "name": getattr(user, 'name', user.username)}
             )
 
-        # Update last login
+        # Update last login (committed below, once the profile is built,
+        # so the expired user isn't reloaded just to read it back)
         if hasattr(user, 'last_login'):
             user.last_login = datetime.utcnow()
-            db.session.commit()
 
         # Get user's tools
         tools = []
@@ -311,7 +339,10 @@ class AuthService(BaseService):
             tools=tools,
         )
 
-        self.logger.info(f"LOGIN SUCCESS: User '{username}' authenticated")
+        db.session.commit()
+
+        # The calling route logs the successful login with its client IP
+        self.logger.debug("User '%s' authenticated", username)
         return ServiceResult.success(LoginResult(user=profile, redirect_route=redirect_route))
 
     def register(
@@ -370,16 +401,19 @@ class AuthService(BaseService):
             if captcha_result.is_failure:
                 return captcha_result
 
-        # Check for existing username
-        if User.query.filter_by(username=username).first():
+        # Check for an existing username or email in one query
+        existing = db.session.query(User.username, User.email).filter(
+            or_(User.username == username, User.email == email.lower())
+        ).all()
+
+        if any(row.username == username for row in existing):
             self.logger.warning(f"Registration failed - username '{username}' already exists")
             return ServiceResult.failure(
                 ErrorCode.RESOURCE_ALREADY_EXISTS,
                 "Username already exists. Please choose a different username."
             )
 
-        # Check for existing email
-        if User.query.filter_by(email=email.lower()).first():
+        if existing:
             self.logger.warning(f"Registration failed - email '{email}' already registered")
             return ServiceResult.failure(
                 ErrorCode.RESOURCE_ALREADY_EXISTS,
@@ -531,7 +565,7 @@ class AuthService(BaseService):
         # Check if already verified
         if hasattr(user, 'email_verified') and user.email_verified:
             return ServiceResult.failure(
-                ErrorCode.VALIDATION_ERROR,
+                ErrorCode.AUTH_ALREADY_VERIFIED,
                 "Your email is already verified. You can log in now."
             )
 
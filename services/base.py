@@ -25,6 +25,7 @@ class ErrorCode(str, Enum):
     # Authentication errors
     AUTH_REQUIRED = "AUTH_REQUIRED"
     AUTH_UNVERIFIED = "AUTH_UNVERIFIED"
+    AUTH_ALREADY_VERIFIED = "AUTH_ALREADY_VERIFIED"
     AUTH_INVALID_CREDENTIALS = "AUTH_INVALID_CREDENTIALS"
     AUTH_RATE_LIMITED = "AUTH_RATE_LIMITED"
 
@@ -80,6 +81,7 @@ class ServiceError:
             ErrorCode.AUTH_REQUIRED: 401,
             ErrorCode.AUTH_INVALID_CREDENTIALS: 401,
             ErrorCode.AUTH_UNVERIFIED: 403,
+            ErrorCode.AUTH_ALREADY_VERIFIED: 400,
             ErrorCode.AUTH_RATE_LIMITED: 429,
             ErrorCode.PERMISSION_DENIED: 403,
             ErrorCode.VALIDATION_ERROR: 400,
@@ -11,10 +11,11 @@ This replaces the scattered email logic in auth_routes.py and contact_routes.py.
 
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from dataclasses import dataclass
 
-from flask import render_template, url_for
+from flask import current_app, render_template, url_for
 from flask_mail import Mail, Message
 
 from .base import BaseService, ServiceResult, ErrorCode
@@ -22,6 +23,10 @@ from .token_service import get_token_service
 
 logger = logging.getLogger(__name__)
 
+# Sends whose outcome the caller never reports back to the user go through
+# this pool, so the request doesn't wait on the SMTP handshake.
+_background_sender = ThreadPoolExecutor(max_workers=2, thread_name_prefix="mail")
+
 
 @dataclass
 class EmailConfig:
@@ -77,6 +82,20 @@ class EmailService(BaseService):
                 "Call set_mail() with Flask-Mail instance first."
             )
 
+    def _send_in_background(self, msg: Message, operation: str, email: str):
+        """Send msg on the background pool inside an app context; failures are only logged."""
+        app = current_app._get_current_object()
+
+        def send():
+            with app.app_context():
+                try:
+                    self._mail.send(msg)
+                    self.logger.info("%s: sent to %s", operation, email)
+                except Exception as e:
+                    self._log_error(operation, e, email=email)
+
+        _background_sender.submit(send)
+
     def send_verification_email(
         self,
         email: str,
@@ -146,12 +165,16 @@ If you didn't create an account, please ignore this email.
         """
         Send password reset email.
 
+        The message is built here but sent in the background: callers never
+        tell the user whether it went out, and answering before the SMTP
+        round-trip also keeps response times the same for unknown emails.
+
         Args:
             email: User's email address
             user_name: User's display name
 
         Returns:
-            ServiceResult with True if sent successfully
+            ServiceResult with True once the email is queued
         """
         self._ensure_mail()
         self._log_operation("send_password_reset_email", email=email)
@@ -192,8 +215,8 @@ If you didn't request this reset, please ignore this email.
 (c) 2026 OmniTools. All rights reserved.
 """
 
-            self._mail.send(msg)
-            self.logger.info(f"Password reset email sent successfully to: {email}")
+            self._send_in_background(msg, "send_password_reset_email", email)
+            self.logger.info(f"Password reset email queued for: {email}")
             return ServiceResult.success(True)
 
         except Exception as e:
@@ -11,15 +11,28 @@ This service separates tool business logic from HTTP/route concerns.
 """
 
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
+from sqlalchemy import exists, select
+from sqlalchemy.orm import joinedload
+
 from model import User, Tool, ToolAccess, ToolFavorite, ToolCategory, EmailTemplate, UsageLog, db
 from .base import BaseService, ServiceResult, ErrorCode
 
 logger = logging.getLogger(__name__)
 
+# Roles with access to every tool
+ADMIN_ROLES = frozenset({"admin", "super_admin", "superadmin"})
+
+# Calculator variants accepted by calculate_tax
+TAX_CALCULATOR_TYPES = ("us", "canada", "vat")
+
+# Upper bounds on a single tax calculation, which runs on the request thread
+MAX_TAX_ITEMS = 500
+MAX_TAX_DISCOUNTS = 100
+
 
 @dataclass
 class ToolInfo:
@@ -192,6 +205,65 @@ class ToolService(BaseService):
                 "Failed to retrieve user tools."
             )
 
+    def get_tools_with_access(
+        self,
+        user_id: int,
+        user_role: Optional[str] = None,
+        include_inactive: bool = False
+    ) -> ServiceResult[List[Tuple[ToolInfo, bool]]]:
+        """
+        Get the tool catalog with a per-tool access flag for a user.
+
+        Loads the tools, their categories and required plans, and whether
+        the user holds an explicit grant, in a single query.
+
+        Args:
+            user_id: The user's ID
+            user_role: User's role; admins have access to every tool
+            include_inactive: Whether to include inactive tools
+
+        Returns:
+            ServiceResult with a list of (ToolInfo, has_access) pairs
+        """
+        try:
+            granted = exists().where(
+                ToolAccess.user_id == user_id,
+                ToolAccess.tool_name == Tool.name
+            )
+            query = (
+                db.session.query(Tool, granted)
+                .options(joinedload(Tool.category), joinedload(Tool.required_plan))
+            )
+            if not include_inactive:
+                query = query.filter(Tool.is_active.is_(True))
+            rows = query.all()
+
+            is_admin = user_role in ADMIN_ROLES
+
+            # Paid tools are also unlocked by a sufficient subscription tier
+            user_tier = None
+            if not is_admin:
+                from .subscription_service import get_subscription_service
+                user_tier = get_subscription_service().get_active_tier(user_id)
+
+            tools = []
+            for tool, has_grant in rows:
+                info = self._tool_to_info(tool)
+                # Same rule as get_user_tools: active tools that are default or granted
+                has_access = is_admin or (info.is_active and (info.is_default or has_grant))
+                if not has_access and info.is_paid and info.required_plan_tier is not None:
+                    has_access = user_tier is not None and user_tier >= info.required_plan_tier
+                tools.append((info, has_access))
+
+            return ServiceResult.success(tools)
+
+        except Exception as e:
+            self._log_error("get_tools_with_access", e, user_id=user_id)
+            return ServiceResult.failure(
+                ErrorCode.DATABASE_ERROR,
+                "Failed to retrieve tools."
+            )
+
     def check_tool_access(
         self,
         user_id: int,
@@ -212,7 +284,7 @@ class ToolService(BaseService):
             ServiceResult with True if user has access
         """
         # Admins have access to all tools
-        if user_role in ["admin", "super_admin", "superadmin"]:
+        if user_role in ADMIN_ROLES:
             return ServiceResult.success(True)
 
         try:
@@ -411,6 +483,19 @@ class ToolService(BaseService):
         Returns:
             ServiceResult with calculation result
         """
+        for field, limit in (("items", MAX_TAX_ITEMS), ("discounts", MAX_TAX_DISCOUNTS)):
+            values = data.get(field) or []
+            if not isinstance(values, list):
+                return ServiceResult.failure(
+                    ErrorCode.VALIDATION_ERROR,
+                    f"{field.capitalize()} must be a list."
+                )
+            if len(values) > limit:
+                return ServiceResult.failure(
+                    ErrorCode.VALIDATION_ERROR,
+                    f"A calculation can include at most {limit} {field}."
+                )
+
         try:
             from Tools.tax_calculator import tax_calculator as calculate, calculate_vat
 
@@ -517,6 +602,42 @@ class ToolService(BaseService):
                 "Failed to retrieve email templates."
             )
 
+    def get_user_email_template_dicts(
+        self,
+        user_id: int
+    ) -> ServiceResult[List[Dict[str, Any]]]:
+        """
+        Get all email templates for a user as API-ready dicts.
+
+        Selects the columns directly instead of loading EmailTemplate
+        objects, for the list endpoint where nothing else needs the ORM rows.
+
+        Args:
+            user_id: The user's ID
+
+        Returns:
+            ServiceResult with a list of dicts shaped like EmailTemplateData.to_dict()
+        """
+        try:
+            rows = db.session.execute(
+                select(
+                    EmailTemplate.id,
+                    EmailTemplate.user_id,
+                    EmailTemplate.title,
+                    EmailTemplate.content,
+                ).where(EmailTemplate.user_id == user_id)
+            ).mappings()
+            # email_templates has no timestamp column; keep the key for API parity
+            template_list = [{**row, "created_at": None} for row in rows]
+            return ServiceResult.success(template_list)
+
+        except Exception as e:
+            self._log_error("get_user_email_template_dicts", e, user_id=user_id)
+            return ServiceResult.failure(
+                ErrorCode.DATABASE_ERROR,
+                "Failed to retrieve email templates."
+            )
+
     def create_email_template(
         self,
         user_id: int,
@@ -0,0 +1,213 @@
+"""
+User Cache Module
+
+Short-lived Redis cache of serialized user profiles and tool lists, used by
+high-frequency read paths such as GET /api/v1/auth/status and
+GET /api/v1/tools.
+
+Entries are invalidated automatically whenever a User, ToolAccess or
+UserSubscription row is changed through the ORM and the transaction commits,
+and tool lists are also dropped when the tool catalog (tools, categories,
+plans) changes, so callers never need to remember to evict. The TTL bounds
+staleness for changes made outside the ORM (bulk queries, scripts) and for
+subscriptions that expire with time.
+
+Without Redis configured every function is a no-op.
+"""
+
+import logging
+from itertools import chain
+from typing import Optional, Dict, Any, List
+
+import orjson
+import redis
+from flask import has_app_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from model import User, ToolAccess, Tool, ToolCategory, SubscriptionPlan, UserSubscription
+from utils.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+USER_CACHE_TTL = 60  # seconds
+USER_CACHE_KEY = "user:{}"
+# Hash of tool lists per user, one field per view of the list
+USER_TOOLS_KEY = "user_tools:{}"
+# Bumped on every catalog change; cached tool lists from older versions are ignored
+TOOL_CATALOG_VERSION_KEY = "tools:version"
+
+
+def get_cached_user_profile(user_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Get a cached user profile dict.
+
+    Args:
+        user_id: The user's ID
+
+    Returns:
+        The cached profile dict, or None on a miss or when Redis is unavailable
+    """
+    client = get_redis()
+    if client is None:
+        return None
+
+    try:
+        cached = client.get(USER_CACHE_KEY.format(user_id))
+    except redis.RedisError as e:
+        logger.warning("User cache read failed: %s", e)
+        return None
+
+    return orjson.loads(cached) if cached else None
+
+
+def cache_user_profile(user_id: int, profile: Dict[str, Any]) -> None:
+    """
+    Cache a user profile dict for USER_CACHE_TTL seconds.
+
+    Args:
+        user_id: The user's ID
+        profile: Serializable profile dict (UserProfile.to_dict())
+    """
+    client = get_redis()
+    if client is None:
+        return
+
+    try:
+        client.set(USER_CACHE_KEY.format(user_id), orjson.dumps(profile), ex=USER_CACHE_TTL)
+    except redis.RedisError as e:
+        logger.warning("User cache write failed: %s", e)
+
+
+def invalidate_user_cache(*user_ids: int) -> None:
+    """
+    Drop cached profiles for the given users.
+
+    Args:
+        user_ids: IDs of the users whose cached profiles are stale
+    """
+    client = get_redis()
+    if client is None or not user_ids:
+        return
+
+    keys = [key.format(user_id) for user_id in user_ids for key in (USER_CACHE_KEY, USER_TOOLS_KEY)]
+    try:
+        client.delete(*keys)
+    except redis.RedisError as e:
+        logger.warning("User cache invalidation failed: %s", e)
+
+
+def get_cached_user_tools(user_id: int, variant: str) -> Optional[List[Any]]:
+    """
+    Get a cached tool list for a user.
+
+    Args:
+        user_id: The user's ID
+        variant: Which view of the tool list (e.g. role and filters)
+
+    Returns:
+        The cached list, or None on a miss, after a catalog change, or when
+        Redis is unavailable
+    """
+    client = get_redis()
+    if client is None:
+        return None
+
+    try:
+        # One round trip for both the catalog version and the entry
+        pipe = client.pipeline(transaction=False)
+        pipe.get(TOOL_CATALOG_VERSION_KEY)
+        pipe.hget(USER_TOOLS_KEY.format(user_id), variant)
+        version, cached = pipe.execute()
+    except redis.RedisError as e:
+        logger.warning("Tool list cache read failed: %s", e)
+        return None
+
+    if not cached:
+        return None
+
+    entry = orjson.loads(cached)
+    if entry["version"] != _version_str(version):
+        return None
+    return entry["tools"]
+
+
+def cache_user_tools(user_id: int, variant: str, tools: List[Any]) -> None:
+    """
+    Cache a tool list for a user for USER_CACHE_TTL seconds.
+
+    Args:
+        user_id: The user's ID
+        variant: Which view of the tool list (e.g. role and filters)
+        tools: Serializable tool list
+    """
+    client = get_redis()
+    if client is None:
+        return
+
+    key = USER_TOOLS_KEY.format(user_id)
+    try:
+        version = client.get(TOOL_CATALOG_VERSION_KEY)
+        entry = orjson.dumps({"version": _version_str(version), "tools": tools})
+        pipe = client.pipeline(transaction=False)
+        pipe.hset(key, variant, entry)
+        pipe.expire(key, USER_CACHE_TTL)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning("Tool list cache write failed: %s", e)
+
+
+def invalidate_tool_catalog() -> None:
+    """Mark every cached tool list stale after a catalog change."""
+    client = get_redis()
+    if client is None:
+        return
+
+    try:
+        client.incr(TOOL_CATALOG_VERSION_KEY)
+    except redis.RedisError as e:
+        logger.warning("Tool catalog invalidation failed: %s", e)
+
+
+def _version_str(version: Optional[bytes]) -> Optional[str]:
+    return version.decode() if version is not None else None
+
+
+# ==================== Automatic Invalidation ====================
+
+_STALE_USERS_KEY = 'stale_user_ids'
+_CATALOG_CHANGED_KEY = 'tool_catalog_changed'
+
+
+@event.listens_for(Session, 'after_flush')
+def _collect_stale_users(session, flush_context):
+    """Record users whose profile data or tool access changed in this flush."""
+    stale = session.info.setdefault(_STALE_USERS_KEY, set())
+    for obj in chain(session.dirty, session.deleted):
+        if isinstance(obj, User):
+            stale.add(obj.id)
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, (ToolAccess, UserSubscription)):
+            stale.add(obj.user_id)
+        elif isinstance(obj, (Tool, ToolCategory, SubscriptionPlan)):
+            session.info[_CATALOG_CHANGED_KEY] = True
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_stale_users(session):
+    """Evict cached profiles and tool lists once the changes are committed."""
+    stale = session.info.pop(_STALE_USERS_KEY, None)
+    catalog_changed = session.info.pop(_CATALOG_CHANGED_KEY, False)
+    if not has_app_context():
+        return
+    if stale:
+        invalidate_user_cache(*stale)
+    if catalog_changed:
+        invalidate_tool_catalog()
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _discard_stale_users(session, previous_transaction):
+    """Nothing was committed, so nothing needs evicting."""
+    session.info.pop(_STALE_USERS_KEY, None)
+    session.info.pop(_CATALOG_CHANGED_KEY, None)
@@ -15,7 +15,9 @@ from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 from datetime import datetime
 
-from model import User, Admin, SuperAdmin, db, ToolAccess, UserFactory
+from sqlalchemy import func
+
+from model import User, Admin, SuperAdmin, db, UserFactory
 from config.auth_config import AuthConfig
 from .base import BaseService, ServiceResult, ErrorCode
 
@@ -146,9 +148,9 @@ class UserService(BaseService):
             )
 
         # Get user's tools
-        tools = self._get_user_tools(user_id)
+        tools = self._get_user_tools(user)
 
-        # Get usage stats (optional - could be expensive for large datasets)
+        # Get usage stats
         usage_stats = self._get_usage_stats(user_id)
 
         return ServiceResult.success(DashboardData(
@@ -175,7 +177,7 @@ class UserService(BaseService):
                 "User not found."
             )
 
-        tools = self._get_user_tools(user_id)
+        tools = self._get_user_tools(user)
         return ServiceResult.success(tools)
 
     def update_profile(
@@ -422,23 +424,24 @@ class UserService(BaseService):
             is_active=getattr(user, 'is_active', True),
         )
 
-    def _get_user_tools(self, user_id: int) -> List[str]:
+    def _get_user_tools(self, user: User) -> List[str]:
         """Get list of tool names for a user."""
-        tool_access_list = ToolAccess.query.filter_by(user_id=user_id).all()
-        return [access.tool_name for access in tool_access_list]
+        # tool_access is selectin-loaded with the user, so this costs no query
+        return [access.tool_name for access in user.tool_access]
 
     def _get_usage_stats(self, user_id: int) -> Optional[Dict[str, int]]:
         """Get usage statistics for a user."""
-        # This could be expensive - consider caching or lazy loading
         try:
             from model import UsageLog
-            logs = UsageLog.query.filter_by(user_id=user_id).all()
-
-            stats = {}
-            for log in logs:
-                tool_name = getattr(log, 'tool_name', 'unknown')
-                stats[tool_name] = stats.get(tool_name, 0) + 1
+            # Count per tool in the database instead of loading every log row
+            rows = (
+                db.session.query(UsageLog.tool_name, func.count(UsageLog.id))
+                .filter(UsageLog.user_id == user_id)
+                .group_by(UsageLog.tool_name)
+                .all()
+            )
 
+            stats = dict(rows)
             return stats if stats else None
 
         except Exception as e:
@@ -24,6 +24,8 @@ def app(monkeypatch):
         'TESTING': True,
         'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
         'WTF_CSRF_ENABLED': False,  # Disable CSRF for testing
+        'REDIS_URL': None,  # Cookie sessions, no caching, even if REDIS_URL is set
+        'RATELIMIT_ENABLED': False,
         'SECRET_KEY': os.getenv('SECRET_KEY', 'test-secret-key'),
         'SECURITY_PASSWORD_SALT': os.getenv('SECURITY_PASSWORD_SALT', 'test-salt'),
         'TOKEN_SECRET_KEY': os.getenv('TOKEN_SECRET_KEY', 'test-token-key')
@@ -102,4 +104,65 @@ def logged_in_superadmin(client):
         session['username'] = 'superadmin'
         session['role'] = 'super_admin'
     yield
-    client.get('/logout')
\ No newline at end of file
+    client.get('/logout')
+
+class FakeRedis:
+    """Dict-backed stand-in for the few Redis commands the user cache uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    @staticmethod
+    def _bytes(value):
+        return value if isinstance(value, bytes) else str(value).encode()
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = self._bytes(value)
+
+    def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def incr(self, key):
+        value = int(self.data.get(key, b'0')) + 1
+        self.data[key] = self._bytes(value)
+        return value
+
+    def hget(self, key, field):
+        return self.data.get(key, {}).get(field)
+
+    def hset(self, key, field, value):
+        self.data.setdefault(key, {})[field] = self._bytes(value)
+
+    def expire(self, key, seconds):
+        return key in self.data
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._calls.append((getattr(self._client, name), args, kwargs))
+            return self
+        return queue
+
+    def execute(self):
+        calls, self._calls = self._calls, []
+        return [method(*args, **kwargs) for method, args, kwargs in calls]
+
+
+@pytest.fixture
+def fake_redis(app):
+    """Serve get_redis() from an in-memory FakeRedis for this test's app."""
+    fake = FakeRedis()
+    app.extensions['redis'] = fake
+    yield fake
+    app.extensions['redis'] = None
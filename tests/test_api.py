@@ -95,6 +95,33 @@ class TestAuthAPI:
         assert data['success'] is False
         assert data['error']['code'] == 'VALIDATION_ERROR'
 
+    def test_login_json_suffix_content_type(self, client, init_database):
+        """Test login accepts +json media types and mixed-case content types."""
+        for content_type in ('application/vnd.api+json', 'Application/JSON; charset=utf-8'):
+            response = client.post(
+                '/api/v1/auth/login',
+                data='{"username": "testuser", "password": "testpass"}',
+                content_type=content_type
+            )
+
+            assert response.status_code == 200
+            assert response.get_json()['success'] is True
+
+    def test_login_malformed_json(self, client, init_database):
+        """Test login with an unparseable JSON body returns error."""
+        response = client.post(
+            '/api/v1/auth/login',
+            data='{"username": "testuser",',
+            content_type='application/json'
+        )
+
+        assert response.status_code == 400
+        data = response.get_json()
+
+        assert data['success'] is False
+        assert data['error']['code'] == 'VALIDATION_ERROR'
+        assert data['error']['message'] == 'Invalid JSON format'
+
     def test_logout(self, client, init_database):
         """Test logout clears session."""
         # First login
@@ -128,6 +155,18 @@ class TestAuthAPI:
         assert data['data']['isAuthenticated'] is False
         assert data['data']['user'] is None
 
+    def test_auth_status_not_authenticated_revalidates(self, client, init_database):
+        """Test anonymous auth status is answered with 304 when unchanged."""
+        response = client.get('/api/v1/auth/status')
+        etag = response.headers['ETag']
+
+        assert response.headers['Cache-Control'] == 'private, no-cache'
+
+        cached = client.get('/api/v1/auth/status', headers={'If-None-Match': etag})
+
+        assert cached.status_code == 304
+        assert cached.data == b''
+
     def test_auth_status_authenticated(self, client, init_database):
         """Test auth status when logged in."""
         # Login first
@@ -146,6 +185,25 @@ class TestAuthAPI:
         assert data['data']['isAuthenticated'] is True
         assert data['data']['user']['username'] == 'testuser'
 
+    def test_auth_status_deleted_user(self, app, client, init_database):
+        """Test auth status logs out a session whose user was deleted."""
+        client.post(
+            '/api/v1/auth/login',
+            json={'username': 'testuser', 'password': 'testpass'},
+            content_type='application/json'
+        )
+
+        with app.app_context():
+            from model import User, db
+            db.session.delete(User.query.filter_by(username='testuser').first())
+            db.session.commit()
+
+        data = client.get('/api/v1/auth/status').get_json()
+
+        assert data['data']['isAuthenticated'] is False
+        with client.session_transaction() as sess:
+            assert 'user_id' not in sess
+
     def test_get_csrf_token(self, client, init_database):
         """Test CSRF token generation."""
         response = client.get('/api/v1/auth/csrf')
@@ -155,7 +213,7 @@ class TestAuthAPI:
 
         assert data['success'] is True
         assert 'csrfToken' in data['data']
-        assert len(data['data']['csrfToken']) == 64  # 32 bytes hex = 64 chars
+        assert len(data['data']['csrfToken']) == 43  # 32 bytes urlsafe base64 = 43 chars
 
     def test_register_success(self, client, init_database, monkeypatch):
         """Test successful registration."""
@@ -285,6 +343,20 @@ class TestAuthAPI:
         assert data['success'] is False
         assert data['error']['code'] == 'RESOURCE_NOT_FOUND'
 
+    def test_resend_verification_already_verified(self, client, init_database):
+        """Test resend verification for an already verified user."""
+        response = client.post(
+            '/api/v1/auth/resend-verification',
+            json={'email': 'test@test.com'},
+            content_type='application/json'
+        )
+
+        assert response.status_code == 400
+        data = response.get_json()
+
+        assert data['success'] is False
+        assert data['error']['code'] == 'AUTH_ALREADY_VERIFIED'
+
 
 class TestUserAPI:
     """Tests for /api/v1/user/* endpoints."""
@@ -310,6 +382,23 @@ class TestUserAPI:
         assert data['data']['username'] == 'testuser'
         assert data['data']['email'] == 'test@test.com'
 
+    def test_get_profile_not_modified(self, client, init_database):
+        """Test an unchanged profile is answered with 304."""
+        self._login(client)
+
+        etag = client.get('/api/v1/user/profile').headers['ETag']
+        cached = client.get('/api/v1/user/profile', headers={'If-None-Match': etag})
+
+        assert cached.status_code == 304
+        assert cached.data == b''
+
+        # A different profile no longer matches
+        client.patch('/api/v1/user/profile', json={'city': 'Elsewhere'})
+        response = client.get('/api/v1/user/profile', headers={'If-None-Match': etag})
+
+        assert response.status_code == 200
+        assert response.get_json()['data']['city'] == 'Elsewhere'
+
     def test_get_profile_not_authenticated(self, client, init_database):
         """Test getting profile when not logged in returns 401."""
         response = client.get('/api/v1/user/profile')
@@ -342,6 +431,64 @@ class TestUserAPI:
         assert data['data']['lname'] == 'Name'
         assert data['data']['city'] == 'New City'
 
+    def test_update_email_requires_reverification(self, client, init_database):
+        """Test that changing email blocks verified-only endpoints until re-verified."""
+        self._login(client)
+
+        response = client.put(
+            '/api/v1/user/email',
+            json={'new_email': 'new@test.com', 'current_password': 'testpass'},
+            content_type='application/json'
+        )
+        assert response.status_code == 200
+
+        response = client.patch(
+            '/api/v1/user/profile',
+            json={'city': 'New City'},
+            content_type='application/json'
+        )
+
+        assert response.status_code == 403
+        data = response.get_json()
+        assert data['error']['code'] == 'AUTH_UNVERIFIED'
+        assert data['error']['details']['email'] == 'new@test.com'
+
+    def test_verification_checked_on_every_request(self, client, init_database, app):
+        """Test that an existing session loses verified access once the account is unverified."""
+        self._login(client)
+
+        with app.app_context():
+            from model import User, db
+            user = User.query.filter_by(username='testuser').first()
+            user.email_verified = False
+            db.session.commit()
+
+        response = client.patch(
+            '/api/v1/user/profile',
+            json={'city': 'New City'},
+            content_type='application/json'
+        )
+
+        assert response.status_code == 403
+        assert response.get_json()['error']['code'] == 'AUTH_UNVERIFIED'
+
+    def test_auth_status_reflects_profile_update(self, client, init_database):
+        """Test auth status returns the updated profile right after a change."""
+        self._login(client)
+        client.get('/api/v1/auth/status')
+
+        response = client.patch(
+            '/api/v1/user/profile',
+            json={'name': 'Renamed User'},
+            content_type='application/json'
+        )
+        assert response.status_code == 200
+
+        response = client.get('/api/v1/auth/status')
+        data = response.get_json()
+
+        assert data['data']['user']['name'] == 'Renamed User'
+
     def test_change_password(self, client, init_database):
         """Test password change."""
         self._login(client)
@@ -405,6 +552,29 @@ class TestUserAPI:
         assert 'tools' in data['data']
         assert isinstance(data['data']['tools'], list)
 
+    def test_get_user_tools_cache_misses_after_tool_change(self, app, client, init_database, fake_redis):
+        """Test a committed Tool change makes the next tool list request miss the cache."""
+        from unittest.mock import patch
+        from model import Tool, db
+        from services import ToolService
+
+        self._login(client)
+
+        with patch.object(ToolService, 'get_user_tools', autospec=True,
+                          side_effect=ToolService.get_user_tools) as lookup:
+            assert client.get('/api/v1/user/tools').status_code == 200
+            assert client.get('/api/v1/user/tools').status_code == 200
+            assert lookup.call_count == 1
+
+            with app.app_context():
+                tool = Tool.query.filter_by(name='Test Tool 1').first()
+                tool.description = 'Changed'
+                db.session.commit()
+
+            data = client.get('/api/v1/user/tools').get_json()
+            assert lookup.call_count == 2
+            assert data['data']['tools'] == ['Test Tool 1']
+
     def test_get_dashboard(self, client, init_database):
         """Test getting dashboard data."""
         self._login(client)
@@ -492,6 +662,75 @@ class TestToolAPI:
         assert 'total_characters' in data['data']
         assert data['data']['total_characters'] == 11
 
+    def test_character_counter_invalid_limit(self, client, init_database, app):
+        """Test character counter rejects a non-integer limit."""
+        with app.app_context():
+            from model import ToolAccess, Tool, User, db
+            user = User.query.filter_by(username='testuser').first()
+            db.session.add(Tool(name='Character Counter', description='Count chars', route='/char_counter'))
+            db.session.add(ToolAccess(user_id=user.id, tool_name='Character Counter'))
+            db.session.commit()
+
+        self._login(client)
+
+        response = client.post(
+            '/api/v1/tools/character-counter',
+            json={'text': 'Hello', 'char_limit': 'lots'},
+            content_type='application/json'
+        )
+
+        assert response.status_code == 400
+        data = response.get_json()
+
+        assert data['error']['code'] == 'VALIDATION_ERROR'
+        assert 'char_limit' in data['error']['details']['errors']
+
+    def test_character_counter_limit_out_of_range(self, client, init_database, app):
+        """Test character counter rejects a limit too large to be meaningful."""
+        with app.app_context():
+            from model import ToolAccess, Tool, User, db
+            user = User.query.filter_by(username='testuser').first()
+            db.session.add(Tool(name='Character Counter', description='Count chars', route='/char_counter'))
+            db.session.add(ToolAccess(user_id=user.id, tool_name='Character Counter'))
+            db.session.commit()
+
+        self._login(client)
+
+        response = client.post(
+            '/api/v1/tools/character-counter',
+            json={'text': 'a', 'char_limit': 123456789012345678901234567890},
+            content_type='application/json'
+        )
+
+        assert response.status_code == 400
+        data = response.get_json()
+
+        assert data['error']['code'] == 'VALIDATION_ERROR'
+        assert 'char_limit' in data['error']['details']['errors']
+
+    def test_character_counter_missing_text(self, client, init_database, app):
+        """Test character counter treats a missing text as empty."""
+        with app.app_context():
+            from model import ToolAccess, Tool, User, db
+            user = User.query.filter_by(username='testuser').first()
+            db.session.add(Tool(name='Character Counter', description='Count chars', route='/char_counter'))
+            db.session.add(ToolAccess(user_id=user.id, tool_name='Character Counter'))
+            db.session.commit()
+
+        self._login(client)
+
+        response = client.post(
+            '/api/v1/tools/character-counter',
+            json={'char_limit': 100},
+            content_type='application/json'
+        )
+
+        assert response.status_code == 200
+        data = response.get_json()
+
+        assert data['success'] is True
+        assert data['data']['total_characters'] == 0
+
     def test_character_counter_no_access(self, client, init_database):
         """Test character counter without tool access returns 403."""
         self._login(client)
@@ -557,3 +796,122 @@ class TestAPIResponseFormat:
         assert 'message' in data['error']
         # Should not have data key on error
         assert 'data' not in data
+
+    def test_oversized_body_rejected(self, client, init_database):
+        """Test bodies over MAX_CONTENT_LENGTH get a 413 error envelope."""
+        response = client.post(
+            '/api/v1/auth/login',
+            json={'username': 'testuser', 'password': 'x' * (1024 * 1024)},
+            content_type='application/json'
+        )
+
+        assert response.status_code == 413
+        assert response.get_json()['error']['code'] == 'VALIDATION_ERROR'
+
+    def test_response_with_large_integer(self, app):
+        """Test integers beyond 64 bits still serialize instead of raising."""
+        from routes.api import api_response
+
+        with app.app_context():
+            response = api_response({'value': 2 ** 70})
+
+        assert response.status_code == 200
+        assert response.get_json()['data']['value'] == 2 ** 70
+
+    def test_service_error_format(self, app):
+        """Test that failed ServiceResults map onto the error envelope."""
+        from routes.api import service_error
+        from services.base import ServiceResult, ErrorCode
+
+        result = ServiceResult.failure(
+            ErrorCode.VALIDATION_ERROR,
+            "Username is required.",
+            details={"field": "username"}
+        )
+
+        with app.app_context():
+            response = service_error(result)
+
+        data = response.get_json()
+        assert response.status_code == 400
+        assert data['error'] == {
+            'code': 'VALIDATION_ERROR',
+            'message': 'Username is required.',
+            'details': {'field': 'username'}
+        }
+
+
+class TestValidationSchemas:
+    """Tests for the shared request validation schemas."""
+
+    def test_register_schema_valid(self):
+        """Test a valid registration payload loads."""
+        from routes.api.schemas import REGISTER_SCHEMA, validate_request
+
+        validated, errors = validate_request(REGISTER_SCHEMA, {
+            'name': 'New User',
+            'username': 'new_user',
+            'email': 'new@test.com',
+            'password': 'password123',
+            'confirm_password': 'password123'
+        })
+
+        assert errors is None
+        assert validated['username'] == 'new_user'
+        assert validated['recaptcha_token'] is None
+
+    def test_register_schema_rejects_bad_username(self):
+        """Test the username pattern is enforced."""
+        from routes.api.schemas import REGISTER_SCHEMA, validate_request
+
+        validated, errors = validate_request(REGISTER_SCHEMA, {
+            'name': 'New User',
+            'username': 'bad name!',
+            'email': 'new@test.com',
+            'password': 'password123',
+            'confirm_password': 'password123'
+        })
+
+        assert validated is None
+        assert 'username' in errors
+
+    def test_tax_schema_default_options(self):
+        """Test omitted tax options fall back to the defaults."""
+        from routes.api.schemas import TAX_CALCULATION_SCHEMA, validate_request
+
+        validated, errors = validate_request(TAX_CALCULATION_SCHEMA, {'calculator_type': 'us'})
+
+        assert errors is None
+        assert validated['options'] == {'is_sales_before_tax': False, 'discount_is_taxable': True}
+
+
+class TestRateLimiting:
+    """Tests for rate limiting on abuse-prone auth endpoints."""
+
+    def test_forgot_password_rate_limited(self, monkeypatch):
+        """Test repeated reset requests from one IP get a 429 envelope."""
+        from main import create_app
+        from services import AuthService
+
+        monkeypatch.setattr(AuthService, 'request_password_reset', lambda self, email: None)
+
+        app = create_app(test_config={
+            'TESTING': True,
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+            'WTF_CSRF_ENABLED': False,
+            'REDIS_URL': None,
+            'RATELIMIT_ENABLED': True,
+        })
+        client = app.test_client()
+
+        statuses = [
+            client.post('/api/v1/auth/forgot-password', json={'email': 'a@test.com'}).status_code
+            for _ in range(4)
+        ]
+
+        assert statuses == [200, 200, 200, 429]
+        assert client.post('/api/v1/auth/forgot-password', json={'email': 'a@test.com'}).headers['Retry-After']
+
+        data = client.post('/api/v1/auth/forgot-password', json={'email': 'a@test.com'}).get_json()
+        assert data['success'] is False
+        assert data['error']['code'] == 'AUTH_RATE_LIMITED'
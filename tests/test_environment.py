@@ -1,4 +1,88 @@
 def test_environment_route(client):
     response = client.get('/environment')
     assert response.status_code == 200
-    assert b"Current environment" in response.data
\ No newline at end of file
+    assert b"Current environment" in response.data
+
+
+def test_cookie_sessions_without_redis(app):
+    assert app.extensions['redis'] is None
+    assert type(app.session_interface).__name__ == 'SecureCookieSessionInterface'
+
+
+def test_redis_sessions_when_configured():
+    from main import create_app
+
+    # The connection pool is lazy, so no Redis server is needed here
+    app = create_app(test_config={
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+        'REDIS_URL': 'redis://localhost:6379/0',
+    })
+
+    assert app.extensions['redis'] is not None
+    assert type(app.session_interface).__name__ == 'RedisSessionInterface'
+
+
+def test_jsonify_uses_orjson_provider(app):
+    from datetime import datetime
+    from flask import jsonify
+
+    assert type(app.json).__name__ == 'OrjsonProvider'
+    with app.test_request_context():
+        response = jsonify(b=1, a=datetime(2024, 1, 2, 3, 4, 5))
+    assert response.get_json() == {'a': 'Tue, 02 Jan 2024 03:04:05 GMT', 'b': 1}
+
+
+def test_jsonify_large_integer(app):
+    from flask import jsonify
+
+    # Beyond orjson's 64-bit range; the provider falls back to the stdlib
+    with app.test_request_context():
+        response = jsonify(value=2 ** 70)
+    assert response.get_json() == {'value': 2 ** 70}
+
+
+def test_client_ip_from_trusted_proxy():
+    from flask import request
+    from main import create_app
+
+    app = create_app(test_config={
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+        'REDIS_URL': None,
+        'TRUSTED_PROXIES': 1,
+    })
+
+    @app.route('/_ip')
+    def client_ip():
+        return request.remote_addr
+
+    # Only the entry appended by our proxy counts; the spoofed one is ignored
+    response = app.test_client().get('/_ip', headers={'X-Forwarded-For': '1.2.3.4, 203.0.113.7'})
+    assert response.data == b'203.0.113.7'
+
+
+def test_client_ip_behind_router_and_next_proxy(monkeypatch):
+    from flask import request
+    from main import create_app
+
+    monkeypatch.setenv('IS_LOCAL', 'false')
+    monkeypatch.setenv('DATABASE_URL', 'sqlite:///:memory:')
+    monkeypatch.delenv('TRUSTED_PROXIES', raising=False)
+
+    app = create_app(test_config={
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+        'REDIS_URL': None,
+    })
+
+    @app.route('/_ip')
+    def client_ip():
+        return request.remote_addr
+
+    # Client-sent entry, then the client as seen by the Heroku router, then
+    # the router's address appended by the Next.js rewrite proxy
+    response = app.test_client().get(
+        '/_ip', headers={'X-Forwarded-For': '1.2.3.4, 203.0.113.7, 10.1.2.3'}
+    )
+    assert response.data == b'203.0.113.7'
@@ -1,7 +1,7 @@
 """
 Tests for Migration Scripts
 
-Tests export_tool_access.py and import_tool_access.py functionality.
+Tests export_tool_access.py, import_tool_access.py and restore_backup.py functionality.
 
 Run with:
     pytest tests/test_migration_scripts.py
@@ -12,10 +12,12 @@ Run with:
 import pytest
 import json
 import os
+import sqlite3
 import tempfile
 from model import db, User, Tool, ToolAccess
 from scripts.export_tool_access import export_tool_access
 from scripts.import_tool_access import import_tool_access, load_export_file
+from scripts import restore_backup
 
 
 class TestExportToolAccess:
@@ -449,3 +451,103 @@ class TestEdgeCases:
                     environment='local',
                     output_path='/nonexistent/readonly/path/export.json'
                 )
+
+
+RESTORE_SCHEMA = """
+CREATE TABLE users (
+    id INTEGER PRIMARY KEY, username TEXT UNIQUE NOT NULL, email TEXT UNIQUE NOT NULL,
+    name TEXT, fname TEXT, lname TEXT, role TEXT
+);
+CREATE TABLE admins (id INTEGER PRIMARY KEY);
+CREATE TABLE super_admins (id INTEGER PRIMARY KEY);
+CREATE TABLE tools (name TEXT PRIMARY KEY);
+CREATE TABLE tool_access (id INTEGER PRIMARY KEY, user_id INTEGER, tool_name TEXT);
+CREATE INDEX ix_tool_access_user_id ON tool_access (user_id);
+CREATE TABLE email_templates (id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL, subject TEXT);
+"""
+
+
+class TestRestoreBackup:
+    """Tests for restore_backup.py"""
+
+    @pytest.fixture
+    def restore_dbs(self, tmp_path, monkeypatch):
+        """Point the restore at fresh backup/current databases under tmp_path"""
+        paths = {}
+        for label in ('backup', 'current'):
+            path = tmp_path / f"{label}.db"
+            conn = sqlite3.connect(path)
+            conn.executescript(RESTORE_SCHEMA)
+            conn.close()
+            paths[label] = str(path)
+
+        monkeypatch.setattr(restore_backup, 'BACKUP_DB', paths['backup'])
+        monkeypatch.setattr(restore_backup, 'CURRENT_DB', paths['current'])
+        monkeypatch.setattr(restore_backup, 'backup_current_db', lambda: None)
+        return paths
+
+    def test_restore_replaces_user_with_conflicting_username(self, restore_dbs):
+        """Test that a backup user clashing on username/email with a different id is restored"""
+        conn = sqlite3.connect(restore_dbs['backup'])
+        conn.execute(
+            "INSERT INTO users (id, username, email, fname, lname, role) "
+            "VALUES (1, 'alice', 'alice@example.com', 'Alice', 'Smith', 'user')"
+        )
+        conn.commit()
+        conn.close()
+
+        conn = sqlite3.connect(restore_dbs['current'])
+        conn.execute(
+            "INSERT INTO users (id, username, email, name, role) "
+            "VALUES (7, 'alice', 'alice@example.com', 'Alice', 'user')"
+        )
+        conn.commit()
+        conn.close()
+
+        assert restore_backup.restore_data() is True
+
+        conn = sqlite3.connect(restore_dbs['current'])
+        users = conn.execute("SELECT id, username, name FROM users").fetchall()
+        conn.close()
+
+        assert users == [(1, 'alice', 'Alice Smith')]
+
+    def test_restore_updates_template_without_losing_current_rows(self, restore_dbs):
+        """Test that email templates are restored by id alongside rows only in the current DB"""
+        conn = sqlite3.connect(restore_dbs['backup'])
+        conn.execute("INSERT INTO email_templates (id, name, subject) VALUES (1, 'welcome', 'Hello again')")
+        conn.commit()
+        conn.close()
+
+        conn = sqlite3.connect(restore_dbs['current'])
+        conn.executemany(
+            "INSERT INTO email_templates (id, name, subject) VALUES (?, ?, ?)",
+            [(1, 'welcome', 'Hello'), (2, 'reset', 'Reset your password')]
+        )
+        conn.commit()
+        conn.close()
+
+        assert restore_backup.restore_data() is True
+
+        conn = sqlite3.connect(restore_dbs['current'])
+        templates = conn.execute("SELECT id, name, subject FROM email_templates ORDER BY id").fetchall()
+        conn.close()
+
+        assert templates == [(1, 'welcome', 'Hello again'), (2, 'reset', 'Reset your password')]
+
+    def test_failed_restore_keeps_indexes(self, restore_dbs):
+        """Test that a restore failing part-way rolls back the dropped indexes too"""
+        # Without the table in the backup the email template step fails
+        conn = sqlite3.connect(restore_dbs['backup'])
+        conn.execute("DROP TABLE email_templates")
+        conn.close()
+
+        assert restore_backup.restore_data() is False
+
+        conn = sqlite3.connect(restore_dbs['current'])
+        indexes = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'tool_access'"
+        ).fetchall()
+        conn.close()
+
+        assert indexes == [('ix_tool_access_user_id',)]
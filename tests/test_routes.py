@@ -51,6 +51,32 @@ def test_user_dashboard_authenticated(client, app):
         db.session.delete(user)
         db.session.commit()
 
+def test_login_regenerates_server_side_session_id(client, app):
+    """Test web login issues a new session id when sessions are stored server-side."""
+    from cachelib import SimpleCache
+    from flask_session.cachelib import CacheLibSessionInterface
+
+    app.session_interface = CacheLibSessionInterface(client=SimpleCache())
+
+    with app.app_context():
+        user = User(username='testuser', email='test@test.com', fname='Test', lname='User',
+                    email_verified=True)
+        user.set_password('testpass')
+        db.session.add(user)
+        db.session.commit()
+
+    # An id handed out before login (e.g. planted by an attacker)
+    with client.session_transaction() as sess:
+        sess['pending_verification_email'] = 'test@test.com'
+    sid_before = client.get_cookie(app.config['SESSION_COOKIE_NAME']).value
+
+    client.post('/login', data={'username': 'testuser', 'password': 'testpass'})
+    sid_after = client.get_cookie(app.config['SESSION_COOKIE_NAME']).value
+
+    assert sid_after != sid_before
+    with client.session_transaction() as sess:
+        assert sess['username'] == 'testuser'
+
 def test_admin_dashboard_authenticated(client):
     with client.session_transaction() as sess:
         sess['logged_in'] = True
@@ -78,4 +104,35 @@ def test_logout(client):
     response = client.get('/logout', follow_redirects=True)
     assert b"Login" in response.data
     with client.session_transaction() as sess:
-        assert 'logged_in' not in sess
\ No newline at end of file
+        assert 'logged_in' not in sess
+
+def test_login_rate_limited_per_account(monkeypatch):
+    """Test repeated logins for one username are throttled even across IPs."""
+    from main import create_app
+    from services import AuthService, ServiceResult, ErrorCode
+
+    calls = []
+
+    def fake_login(self, **kwargs):
+        calls.append(kwargs)
+        return ServiceResult.failure(ErrorCode.AUTH_INVALID_CREDENTIALS, "Invalid username or password")
+
+    monkeypatch.setattr(AuthService, 'login', fake_login)
+
+    app = create_app(test_config={
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+        'WTF_CSRF_ENABLED': False,
+        'REDIS_URL': None,
+        'RATELIMIT_ENABLED': True,
+    })
+    client = app.test_client()
+
+    statuses = [
+        client.post('/login', data={'username': 'victim', 'password': 'guess'},
+                    environ_base={'REMOTE_ADDR': f'10.0.0.{i}'}).status_code
+        for i in range(6)
+    ]
+
+    assert statuses == [200] * 5 + [429]
+    assert len(calls) == 5
@@ -7,6 +7,7 @@ Tests for:
 - ToolService
 - TokenService
 - EmailService
+- User cache (Redis profile and tool list caches)
 """
 
 import sys
@@ -181,6 +182,17 @@ class TestAuthService:
             assert result.is_failure
             assert result.error.code == ErrorCode.AUTH_INVALID_CREDENTIALS
 
+    def test_login_unknown_username_still_checks_a_hash(self, app, init_database):
+        """Test unknown usernames pay the same bcrypt cost as wrong passwords."""
+        with app.app_context():
+            from services import auth_service
+
+            with patch.object(auth_service.BcryptPasswordHasher, 'check_password', return_value=False) as check:
+                result = auth_service.AuthService().login(username="nonexistent", password="testpass")
+
+            assert result.is_failure
+            check.assert_called_once_with("testpass", auth_service._DUMMY_PASSWORD_HASH)
+
     def test_login_invalid_password(self, app, init_database):
         """Test login with wrong password."""
         with app.app_context():
@@ -269,6 +281,25 @@ class TestAuthService:
             assert user is not None
             assert user.email_verified is False
 
+    def test_verify_recaptcha_timeout(self, app, monkeypatch):
+        """Test a slow reCAPTCHA endpoint fails verification instead of hanging."""
+        with app.app_context():
+            import requests
+            from config.auth_config import AuthConfig
+            from services import auth_service
+            from services.base import ErrorCode
+
+            monkeypatch.setattr(AuthConfig, 'RECAPTCHA_SITE_KEY', 'site')
+            monkeypatch.setattr(AuthConfig, 'RECAPTCHA_SECRET_KEY', 'secret')
+            post = Mock(side_effect=requests.Timeout("read timed out"))
+            monkeypatch.setattr(auth_service._recaptcha_http, 'post', post)
+
+            result = auth_service.AuthService().verify_recaptcha("token", "127.0.0.1")
+
+            assert result.is_failure
+            assert result.error.code == ErrorCode.RECAPTCHA_FAILED
+            assert post.call_args.kwargs['timeout'] == auth_service.RECAPTCHA_TIMEOUT
+
     def test_register_duplicate_username(self, app, init_database):
         """Test registration with existing username."""
         with app.app_context():
@@ -359,6 +390,27 @@ class TestAuthService:
             assert updated_user.email_verified is True
 
 
+class TestEmailService:
+    """Tests for EmailService."""
+
+    def test_password_reset_email_sent_in_background(self, app):
+        """Test the reset email is queued and sent off the request thread."""
+        with app.test_request_context():
+            import threading
+            from services.email_service import EmailService
+
+            sent = threading.Event()
+            mail = Mock()
+            mail.send = Mock(side_effect=lambda msg: sent.set())
+
+            result = EmailService(mail).send_password_reset_email("reset@example.com", "Reset User")
+
+            assert result.is_success
+            assert sent.wait(timeout=5)
+            msg = mail.send.call_args[0][0]
+            assert msg.recipients == ["reset@example.com"]
+
+
 class TestUserService:
     """Tests for UserService."""
 
@@ -492,6 +544,52 @@ class TestToolService:
             assert result.is_success
             assert "Test Tool 1" in [tool.name for tool in result.data]
 
+    def test_get_tools_with_access(self, app, init_database):
+        """Test the tool catalog is flagged with the user's access."""
+        with app.app_context():
+            from services.tool_service import ToolService
+
+            user = User.query.filter_by(username="testuser").first()
+            service = ToolService()
+
+            result = service.get_tools_with_access(user.id)
+            access = {tool.name: has_access for tool, has_access in result.data}
+
+            assert result.is_success
+            assert access["Test Tool 1"] is True
+            assert access["Test Tool 2"] is False
+
+            admin_result = service.get_tools_with_access(user.id, user_role="admin")
+            assert all(has_access for _, has_access in admin_result.data)
+
+    def test_calculate_tax_rejects_oversized_input(self, app, init_database):
+        """Test tax calculations are capped at MAX_TAX_ITEMS items."""
+        with app.app_context():
+            from services.tool_service import ToolService, MAX_TAX_ITEMS
+            from services.base import ErrorCode
+
+            service = ToolService()
+            items = [{"price": 1, "tax_rate": 5}] * (MAX_TAX_ITEMS + 1)
+
+            result = service.calculate_tax("us", {"items": items})
+
+            assert result.is_failure
+            assert result.error.code == ErrorCode.VALIDATION_ERROR
+
+    def test_calculate_tax_rejects_non_list_input(self, app, init_database):
+        """Test tax calculations reject items or discounts that are not lists."""
+        with app.app_context():
+            from services.tool_service import ToolService
+            from services.base import ErrorCode
+
+            service = ToolService()
+
+            for data in ({"items": 5}, {"discounts": 7}):
+                result = service.calculate_tax("us", data)
+
+                assert result.is_failure
+                assert result.error.code == ErrorCode.VALIDATION_ERROR
+
     def test_check_tool_access_has_access(self, app, init_database):
         """Test checking tool access when user has access."""
         with app.app_context():
@@ -617,6 +715,12 @@ class TestToolService:
             assert len(result.data) >= 1
             assert any(t.title == "My Template" for t in result.data)
 
+            # The dict variant returns the same payload without ORM objects
+            dict_result = service.get_user_email_template_dicts(user.id)
+
+            assert dict_result.is_success
+            assert dict_result.data == [t.to_dict() for t in result.data]
+
     def test_update_email_template(self, app, init_database):
         """Test updating email template."""
         with app.app_context():
@@ -673,3 +777,81 @@ class TestToolService:
             # Verify template was deleted
             deleted = EmailTemplate.query.get(template_id)
             assert deleted is None
+
+
+class TestUserCache:
+    """Tests for the Redis user cache and its automatic invalidation."""
+
+    def test_profile_cache_hit(self, app, fake_redis):
+        """Test a cached profile is returned as stored."""
+        with app.app_context():
+            from services import get_cached_user_profile, cache_user_profile
+
+            assert get_cached_user_profile(1) is None
+            cache_user_profile(1, {"id": 1, "role": "user"})
+
+            assert get_cached_user_profile(1) == {"id": 1, "role": "user"}
+
+    def test_user_change_invalidates_on_commit(self, app, init_database, fake_redis):
+        """Test committing a User change evicts the profile and tool lists."""
+        with app.app_context():
+            from services import (
+                get_cached_user_profile, cache_user_profile,
+                get_cached_user_tools, cache_user_tools
+            )
+
+            user = User.query.filter_by(username='testuser').first()
+            cache_user_profile(user.id, {"id": user.id, "role": "user"})
+            cache_user_tools(user.id, "names", ["Test Tool 1"])
+
+            user.city = 'Elsewhere'
+            db.session.commit()
+
+            assert get_cached_user_profile(user.id) is None
+            assert get_cached_user_tools(user.id, "names") is None
+
+    def test_tool_access_change_invalidates_on_commit(self, app, init_database, fake_redis):
+        """Test granting tool access evicts the user's cached tool lists."""
+        with app.app_context():
+            from services import get_cached_user_tools, cache_user_tools
+
+            user = User.query.filter_by(username='testuser').first()
+            cache_user_tools(user.id, "names", ["Test Tool 1"])
+
+            db.session.add(ToolAccess(user_id=user.id, tool_name='Test Tool 2'))
+            db.session.commit()
+
+            assert get_cached_user_tools(user.id, "names") is None
+
+    def test_rollback_keeps_cache(self, app, init_database, fake_redis):
+        """Test a rolled back change evicts nothing, even on a later commit."""
+        with app.app_context():
+            from services import get_cached_user_profile, cache_user_profile
+
+            user = User.query.filter_by(username='testuser').first()
+            user_id = user.id
+            cache_user_profile(user_id, {"id": user_id, "role": "user"})
+
+            user.city = 'Elsewhere'
+            db.session.flush()
+            db.session.rollback()
+            db.session.commit()
+
+            assert get_cached_user_profile(user_id) == {"id": user_id, "role": "user"}
+
+    def test_tool_change_bumps_catalog_version(self, app, init_database, fake_redis):
+        """Test committing a Tool change makes every cached tool list stale."""
+        with app.app_context():
+            from services import get_cached_user_tools, cache_user_tools
+            from services.user_cache import TOOL_CATALOG_VERSION_KEY
+
+            user = User.query.filter_by(username='testuser').first()
+            cache_user_tools(user.id, "names", ["Test Tool 1"])
+            assert get_cached_user_tools(user.id, "names") == ["Test Tool 1"]
+
+            tool = Tool.query.filter_by(name='Test Tool 1').first()
+            tool.description = 'Changed'
+            db.session.commit()
+
+            assert fake_redis.get(TOOL_CATALOG_VERSION_KEY) == b'1'
+            assert get_cached_user_tools(user.id, "names") is None
@@ -0,0 +1,33 @@
+"""
+JSON Provider
+orjson-backed replacement for Flask's default JSON provider, used by jsonify,
+request.get_json() and the |tojson template filter.
+
+Output matches DefaultJSONProvider: sorted keys, dates as HTTP dates, and
+dataclasses/UUIDs/Decimals handled the same way.
+"""
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+# Dates go through DefaultJSONProvider.default so they keep Flask's format
+_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Serialize and parse JSON with orjson."""
+
+    def dumps(self, obj, **kwargs):
+        option = _OPTIONS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+        except TypeError:
+            # orjson rejects some values the stdlib encoder accepts, such as
+            # integers beyond 64 bits
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
@@ -0,0 +1,46 @@
+"""
+Rate Limiting
+Provides the shared Flask-Limiter instance used to throttle abuse-prone
+endpoints (login, password reset, verification emails) before they reach
+the database, bcrypt or SMTP.
+
+Counters live in Redis when REDIS_URL is configured (shared across workers)
+and in process memory otherwise. Disable with RATELIMIT_ENABLED=False.
+"""
+import logging
+
+from flask_limiter import Limiter
+from flask_limiter.util import get_remote_address
+
+logger = logging.getLogger(__name__)
+
+# Limits are declared per endpoint with @limiter.limit(...); nothing is
+# throttled by default.
+limiter = Limiter(key_func=get_remote_address)
+
+
+def init_rate_limiter(app):
+    """
+    Bind the limiter to the app, using Redis storage when available.
+
+    Args:
+        app: Flask app instance (init_redis must already have run)
+    """
+    redis_client = app.extensions.get('redis')
+
+    if redis_client is not None:
+        app.config.setdefault('RATELIMIT_STORAGE_URI', app.config['REDIS_URL'])
+        # Reuse the app's connection pool instead of opening a second one
+        app.config.setdefault('RATELIMIT_STORAGE_OPTIONS', {
+            'connection_pool': redis_client.connection_pool
+        })
+        # A Redis outage must not take login down with it
+        app.config.setdefault('RATELIMIT_SWALLOW_ERRORS', True)
+        app.config.setdefault('RATELIMIT_IN_MEMORY_FALLBACK_ENABLED', True)
+    else:
+        app.config.setdefault('RATELIMIT_STORAGE_URI', 'memory://')
+
+    # X-RateLimit-* on limited endpoints, and Retry-After on 429s
+    app.config.setdefault('RATELIMIT_HEADERS_ENABLED', True)
+
+    limiter.init_app(app)
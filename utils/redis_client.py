@@ -0,0 +1,49 @@
+"""
+Redis Client
+Provides the shared Redis connection used for server-side sessions and caching.
+
+Redis is optional: when REDIS_URL is not configured, get_redis() returns None
+and callers fall back to their non-Redis behaviour (signed-cookie sessions,
+no caching).
+"""
+import logging
+
+import redis
+from flask import current_app
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on connections per worker; callers wait for a free connection
+# instead of opening new ones under load.
+DEFAULT_MAX_CONNECTIONS = 64
+
+
+def init_redis(app):
+    """
+    Create the app's Redis client from REDIS_URL, if configured.
+
+    Args:
+        app: Flask app instance
+
+    Returns:
+        redis.Redis client, or None when Redis is not configured
+    """
+    url = app.config.get('REDIS_URL')
+    client = None
+
+    if url:
+        pool = redis.BlockingConnectionPool.from_url(
+            url,
+            max_connections=app.config.get('REDIS_MAX_CONNECTIONS', DEFAULT_MAX_CONNECTIONS),
+            socket_keepalive=True,
+        )
+        client = redis.Redis(connection_pool=pool)
+        logger.info("Redis configured: %s", pool.connection_kwargs.get('host'))
+
+    app.extensions['redis'] = client
+    return client
+
+
+def get_redis():
+    """Return the current app's Redis client, or None when Redis is not configured."""
+    return current_app.extensions.get('redis')